@@ -3,6 +3,7 @@ Core classes for representing and managing Codex runs and sessions.
 """
 
 import os
+import re
 import subprocess
 import tempfile
 import shlex
@@ -13,6 +14,8 @@ from typing import Dict, List, Optional, Any, Union, Callable
 import logging
 import time
 import json
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .models import CodexRunResult, CodexSessionResult, ChangeType, ToolType
 from .parsers import CodexLogParser, CodexOutputParser
@@ -220,9 +223,11 @@ class CodexRun:
             )
         
         try:
-            # Generate log file path
+            # Generate log file path from the whole run_id, so caller-chosen IDs
+            # that share a prefix and start in the same second stay distinct
             timestamp = self.start_time.strftime("%Y%m%d_%H%M%S")
-            self.log_file = os.path.join(log_dir, f"codex_run_{timestamp}_{self.run_id[:8]}.log")
+            safe_run_id = re.sub(r'[^A-Za-z0-9._-]', '_', self.run_id)
+            self.log_file = os.path.join(log_dir, f"codex_run_{timestamp}_{safe_run_id}.log")
             
             # Update health info with log file
             if self.health_monitor and self.health_info:
@@ -482,7 +487,8 @@ class CodexSession:
                  log_dir: str = ".",
                  debug: bool = False,
                  validate_env: bool = True,
-                 enable_health_monitoring: bool = True):
+                 enable_health_monitoring: bool = True,
+                 checkpoint_path: Optional[str] = None):
         """
         Initialize a Codex session.
         
@@ -495,6 +501,9 @@ class CodexSession:
             debug: Enable debug logging
             validate_env: Whether to validate environment variables for the default provider
             enable_health_monitoring: Whether to enable health monitoring for runs
+            checkpoint_path: Optional JSON file recording completed runs. When set,
+                execute_all skips runs whose run_id it lists and whose log file
+                still exists, re-parsing that log instead of calling Codex again
         """
         self.session_id = session_id or str(uuid.uuid4())
         self.default_model = default_model
@@ -503,6 +512,7 @@ class CodexSession:
         self.log_dir = log_dir
         self.debug = debug
         self.enable_health_monitoring = enable_health_monitoring
+        self.checkpoint_path = checkpoint_path
         
         # Validate provider configuration if requested
         if validate_env:
@@ -517,6 +527,8 @@ class CodexSession:
         self.start_time: Optional[datetime] = None
         self.end_time: Optional[datetime] = None
         self.runs: List[CodexRun] = []
+        # Completed run IDs mapped to their log files, loaded from checkpoint_path
+        self._completed: Dict[str, str] = {}
         
         # Results
         self.result: Optional[CodexSessionResult] = None
@@ -533,7 +545,8 @@ class CodexSession:
                 writable_root: Optional[str] = None,
                 timeout: Optional[int] = None,
                 approval_mode: str = "full-auto",
-                dangerously_auto_approve_everything: bool = False) -> CodexRun:
+                dangerously_auto_approve_everything: bool = False,
+                run_id: Optional[str] = None) -> CodexRun:
         """
         Create and add a new run to the session.
         
@@ -545,6 +558,8 @@ class CodexSession:
             timeout: The timeout for the run
             approval_mode: The approval mode for the run
             dangerously_auto_approve_everything: Skip all confirmation prompts (for testing)
+            run_id: Unique identifier for the run. Give runs stable IDs to let a
+                checkpointed session recognise them on a later invocation
             
         Returns:
             The created CodexRun instance
@@ -555,6 +570,7 @@ class CodexSession:
             provider=provider or self.default_provider,
             writable_root=writable_root,
             timeout=timeout or self.default_timeout,
+            run_id=run_id,
             approval_mode=approval_mode,
             debug=self.debug,
             validate_env=False,  # Already validated in session init
@@ -564,15 +580,22 @@ class CodexSession:
         self.runs.append(run)
         return run
     
-    def execute_all(self) -> CodexSessionResult:
+    def execute_all(self, max_workers: int = 1) -> CodexSessionResult:
         """
         Execute all runs in the session.
         
+        Args:
+            max_workers: Number of runs to execute at once. Runs spend their
+                time waiting on the codex subprocess, so values above 1 overlap
+                them on a thread pool; keep it small to stay within provider
+                rate limits.
+        
         Returns:
             CodexSessionResult with aggregate results
         """
         self.start_time = datetime.now()
         self.logger.info(f"Starting session {self.session_id} with {len(self.runs)} runs")
+        self._completed = self._load_checkpoint()
         
         # Print session start banner
         print(f"\n  [{self.start_time.strftime('%H:%M:%S')}] Starting Codex Session:")
@@ -580,53 +603,33 @@ class CodexSession:
         print(f"   🔢 Total Runs: {len(self.runs)}")
         print(f"     Model: {self.default_model} ({self.default_provider})")
         print(f"   ⏱️  Timeout: {self.default_timeout}s per run")
+        if max_workers > 1:
+            print(f"     Workers: {max_workers}")
+        if self._completed:
+            print(f"     Checkpoint: {len(self._completed)} completed run(s) in {self.checkpoint_path}")
         print()
         
-        run_results = []
-        
-        for i, run in enumerate(self.runs, 1):
-            # Print run start info
-            print(f"📍 [{datetime.now().strftime('%H:%M:%S')}] Starting Run {i}/{len(self.runs)}:")
-            print(f"   🆔 Run ID: {run.run_id}")
-            print(f"     Prompt: {run.prompt[:80]}{'...' if len(run.prompt) > 80 else ''}")
-            print(f"     Working Dir: {run.writable_root}")
-            print()
-            
-            self.logger.info(f"Executing run {i}/{len(self.runs)}: {run.run_id}")
-            
-            run_start_time = datetime.now()
-            try:
-                result = run.execute(self.log_dir)
-                run_results.append(result)
-                
-                # Print run completion info
-                run_duration = (datetime.now() - run_start_time).total_seconds()
-                print(f"✅ [{datetime.now().strftime('%H:%M:%S')}] Run {i}/{len(self.runs)} Completed:")
-                print(f"   ⏱️  Duration: {run_duration:.1f}s")
-                print(f"   ✅ Success: {result.success if result else False}")
-                if result and result.changes:
-                    print(f"     Changes: {len(result.changes)}")
-                if result and hasattr(result, 'files_modified'):
-                    print(f"     Files: {len(result.files_modified)}")
-                print()
-                
-            except Exception as e:
-                run_duration = (datetime.now() - run_start_time).total_seconds()
-                print(f"❌ [{datetime.now().strftime('%H:%M:%S')}] Run {i}/{len(self.runs)} Failed:")
-                print(f"   ⏱️  Duration: {run_duration:.1f}s")
-                print(f"   ❌ Error: {str(e)[:100]}{'...' if len(str(e)) > 100 else ''}")
-                print()
-                
-                self.logger.error(f"Run {run.run_id} failed: {e}")
-                # Still add failed result
-                run_results.append(run.result)
+        if max_workers > 1 and len(self.runs) > 1:
+            # Submit every run before collecting any, so up to max_workers
+            # subprocesses are in flight at once
+            finished = []
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(self._execute_run, i, run): run
+                           for i, run in enumerate(self.runs, 1)}
+                for future in as_completed(futures):
+                    finished.append(future.result())
+                    # Checkpoint from this thread only, so writes never overlap
+                    self._save_checkpoint(futures[future])
+                    self._print_session_progress(finished)
             
-            # Print session progress summary
-            successful_so_far = sum(1 for r in run_results if r and r.success)
-            session_runtime = (datetime.now() - self.start_time).total_seconds()
-            print(f"  Session Progress: {i}/{len(self.runs)} runs completed ({successful_so_far} successful) in {session_runtime:.1f}s")
-            print("-" * 60)
-            print()
+            # Keep results in the order the runs were added
+            run_results = [future.result() for future in futures]
+        else:
+            run_results = []
+            for i, run in enumerate(self.runs, 1):
+                run_results.append(self._execute_run(i, run))
+                self._save_checkpoint(run)
+                self._print_session_progress(run_results)
         
         self.end_time = datetime.now()
         
@@ -655,6 +658,102 @@ class CodexSession:
         
         return self.result
     
+    def _execute_run(self, i: int, run: CodexRun) -> Optional[CodexRunResult]:
+        """Execute one run of the session, printing its start and outcome."""
+        run_start_time = datetime.now()
+        try:
+            log_file = self._completed.get(run.run_id)
+            if log_file and os.path.exists(log_file):
+                # Completed on an earlier invocation; re-parsing the log is far
+                # cheaper than repeating the Codex call
+                print(f"⏭️  [{datetime.now().strftime('%H:%M:%S')}] Skipping Run {i}/{len(self.runs)} (checkpointed):")
+                print(f"   🆔 Run ID: {run.run_id}")
+                print(f"     Log: {log_file}")
+                print()
+                
+                self.logger.info(f"Resuming run {i}/{len(self.runs)} from checkpoint: {run.run_id}")
+                run.log_file = log_file
+                run.result = run._parse_results()
+                run.success = True
+                return run.result
+            
+            # Print run start info
+            print(f"📍 [{datetime.now().strftime('%H:%M:%S')}] Starting Run {i}/{len(self.runs)}:")
+            print(f"   🆔 Run ID: {run.run_id}")
+            print(f"     Prompt: {run.prompt[:80]}{'...' if len(run.prompt) > 80 else ''}")
+            print(f"     Working Dir: {run.writable_root}")
+            print()
+            
+            self.logger.info(f"Executing run {i}/{len(self.runs)}: {run.run_id}")
+            
+            run_start_time = datetime.now()
+            result = run.execute(self.log_dir)
+            
+            # Print run completion info
+            run_duration = (datetime.now() - run_start_time).total_seconds()
+            print(f"✅ [{datetime.now().strftime('%H:%M:%S')}] Run {i}/{len(self.runs)} Completed:")
+            print(f"   ⏱️  Duration: {run_duration:.1f}s")
+            print(f"   ✅ Success: {result.success if result else False}")
+            if result and result.changes:
+                print(f"     Changes: {len(result.changes)}")
+            if result and hasattr(result, 'files_modified'):
+                print(f"     Files: {len(result.files_modified)}")
+            print()
+            return result
+            
+        except Exception as e:
+            run_duration = (datetime.now() - run_start_time).total_seconds()
+            print(f"❌ [{datetime.now().strftime('%H:%M:%S')}] Run {i}/{len(self.runs)} Failed:")
+            print(f"   ⏱️  Duration: {run_duration:.1f}s")
+            print(f"   ❌ Error: {str(e)[:100]}{'...' if len(str(e)) > 100 else ''}")
+            print()
+            
+            self.logger.error(f"Run {run.run_id} failed: {e}")
+            # Still add failed result
+            return run.result
+    
+    def _load_checkpoint(self) -> Dict[str, str]:
+        """Load the completed run IDs and log files from checkpoint_path."""
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return {}
+        
+        try:
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('completed', {})
+        except (OSError, ValueError, AttributeError) as e:
+            self.logger.warning(f"Ignoring unreadable checkpoint {self.checkpoint_path}: {e}")
+            return {}
+    
+    def _save_checkpoint(self, run: CodexRun):
+        """Record a completed run in checkpoint_path, replacing the file atomically."""
+        if (not self.checkpoint_path or not run.success or not run.log_file
+                or self._completed.get(run.run_id) == run.log_file):
+            return
+        
+        self._completed[run.run_id] = run.log_file
+        checkpoint_dir = os.path.dirname(os.path.abspath(self.checkpoint_path))
+        os.makedirs(checkpoint_dir, exist_ok=True)
+        
+        # Write beside the checkpoint and rename over it, so an interrupted
+        # session never leaves a truncated file behind
+        fd, tmp_path = tempfile.mkstemp(dir=checkpoint_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'session_id': self.session_id, 'completed': self._completed}, f, indent=2)
+            os.replace(tmp_path, self.checkpoint_path)
+        except OSError as e:
+            self.logger.warning(f"Could not write checkpoint {self.checkpoint_path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def _print_session_progress(self, run_results: List[Optional[CodexRunResult]]):
+        """Print how many runs have finished so far and how many succeeded."""
+        successful_so_far = sum(1 for r in run_results if r and r.success)
+        session_runtime = (datetime.now() - self.start_time).total_seconds()
+        print(f"  Session Progress: {len(run_results)}/{len(self.runs)} runs completed ({successful_so_far} successful) in {session_runtime:.1f}s")
+        print("-" * 60)
+        print()
+    
     def process_csv_data(self, 
                         csv_data: List[Dict[str, str]], 
                         prompt_template: str,
@@ -716,13 +815,11 @@ class CodexSession:
         if not self.result:
             return {}
         
-        tool_counts = {}
-        for run in self.result.runs:
-            for tool_usage in run.tool_usage:
-                tool_name = tool_usage.tool_name
-                tool_counts[tool_name] = tool_counts.get(tool_name, 0) + 1
+        tool_counts = Counter(tool_usage.tool_name
+                              for run in self.result.runs
+                              for tool_usage in run.tool_usage)
         
-        return tool_counts
+        return dict(tool_counts)
     
     def get_runs_by_success(self, success: bool = True) -> List[CodexRunResult]:
         """Get runs filtered by success status."""
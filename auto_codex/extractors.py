@@ -5,7 +5,7 @@ Extractor classes for parsing different types of Codex output data.
 import re
 import json
 import os
-from typing import Dict, List, Optional, Any, Pattern
+from typing import Dict, List, Optional, Any, Pattern, Tuple
 from datetime import datetime
 
 from .models import (
@@ -13,6 +13,36 @@ from .models import (
     ChangeType, ToolType, DiscoveredTool
 )
 
+# Substrings that mark a line as a possible tool/command invocation
+TOOL_CALL_KEYWORDS = ('function_call', 'tool_use', 'tool_call')
+
+
+def parse_json_lines(content: str, keywords: Optional[Tuple[str, ...]] = None) -> List[Tuple[int, str, Any]]:
+    """
+    Decode each JSON line of a log once.
+    
+    The result can be handed to several extractors' extract_entries so the
+    content is split and decoded a single time instead of once per extractor.
+    
+    Args:
+        content: Raw log content
+        keywords: If given, only lines containing one of these are decoded
+        
+    Returns:
+        List of (line_num, line, entry) tuples; lines that are not valid JSON
+        are left out
+    """
+    entries = []
+    for line_num, line in enumerate(content.split('\n'), 1):
+        if keywords and not any(keyword in line for keyword in keywords):
+            continue
+        try:
+            # Drop a CRLF remainder so the stored line matches splitlines()
+            entries.append((line_num, line.rstrip('\r'), json.loads(line)))
+        except json.JSONDecodeError:
+            continue
+    return entries
+
 
 class BaseExtractor:
     """Base class for all extractors."""
@@ -42,6 +72,10 @@ class PatchExtractor(BaseExtractor):
     
     def extract(self, log_file: str, content: str) -> List[PatchData]:
         """Extract patch information from log content."""
+        return self.extract_entries(log_file, parse_json_lines(content))
+    
+    def extract_entries(self, log_file: str, entries: List[Tuple[int, str, Any]]) -> List[PatchData]:
+        """Extract patch information from already-decoded log lines."""
         results = []
         # This regex looks for Add File or Update File, then the file path, then the patch content
         patch_pattern = re.compile(
@@ -49,10 +83,8 @@ class PatchExtractor(BaseExtractor):
             re.DOTALL | re.IGNORECASE
         )
 
-        for line in content.splitlines():
+        for _, _, log_entry in entries:
             try:
-                log_entry = json.loads(line)
-                
                 if log_entry.get('name') == 'shell' and 'arguments' in log_entry:
                     args_str = log_entry.get('arguments', '{}')
                     
@@ -81,7 +113,7 @@ class PatchExtractor(BaseExtractor):
                                     raw_patch=command_list[1]  # Store original
                                 ))
 
-            except (json.JSONDecodeError, KeyError, TypeError, IndexError):
+            except (KeyError, TypeError, IndexError):
                 continue
         
         return results
@@ -92,17 +124,20 @@ class CommandExtractor(BaseExtractor):
     
     def extract(self, log_file: str, content: str) -> List[CodexCommand]:
         """Extract command information from log content."""
+        return self.extract_entries(log_file, parse_json_lines(content, TOOL_CALL_KEYWORDS))
+    
+    def extract_entries(self, log_file: str, entries: List[Tuple[int, str, Any]]) -> List[CodexCommand]:
+        """Extract command information from already-decoded log lines."""
         results = []
         
-        for line_num, line in enumerate(content.split('\n'), 1):
+        for line_num, line, json_obj in entries:
             # Look for any JSON that could represent a tool/command invocation
-            if any(keyword in line for keyword in ['function_call', 'tool_use', 'tool_call']):
+            if any(keyword in line for keyword in TOOL_CALL_KEYWORDS):
                 try:
-                    json_obj = json.loads(line)
                     command = self._parse_command_json(json_obj, log_file, line_num)
                     if command:
                         results.append(command)
-                except (json.JSONDecodeError, KeyError):
+                except KeyError:
                     continue
         
         return results
@@ -148,17 +183,20 @@ class ToolUsageExtractor(BaseExtractor):
     
     def extract(self, log_file: str, content: str) -> List[ToolUsage]:
         """Extract tool usage information from log content."""
+        return self.extract_entries(log_file, parse_json_lines(content, TOOL_CALL_KEYWORDS))
+    
+    def extract_entries(self, log_file: str, entries: List[Tuple[int, str, Any]]) -> List[ToolUsage]:
+        """Extract tool usage information from already-decoded log lines."""
         results = []
         
-        for line in content.split('\n'):
+        for _, line, json_obj in entries:
             # Look for tool usage patterns
-            if any(keyword in line for keyword in ['function_call', 'tool_use', 'tool_call']):
+            if any(keyword in line for keyword in TOOL_CALL_KEYWORDS):
                 try:
-                    json_obj = json.loads(line)
                     tool_usage = self._parse_tool_usage(json_obj, log_file)
                     if tool_usage:
                         results.append(tool_usage)
-                except (json.JSONDecodeError, KeyError):
+                except KeyError:
                     continue
         
         return results
@@ -227,10 +265,13 @@ class ChangeDetector(BaseExtractor):
     
     def extract(self, log_file: str, content: str) -> List[CodexChange]:
         """Extract change information from log content by parsing JSON."""
+        return self.extract_entries(log_file, parse_json_lines(content))
+    
+    def extract_entries(self, log_file: str, entries: List[Tuple[int, str, Any]]) -> List[CodexChange]:
+        """Extract change information from already-decoded log lines."""
         results = []
-        for line in content.splitlines():
+        for _, line, log_entry in entries:
             try:
-                log_entry = json.loads(line)
                 if log_entry.get('type') == 'codex_change':
                     change_type_str = log_entry.get('change_type', 'unknown')
                     file_path = log_entry.get('file_path')
@@ -243,7 +284,7 @@ class ChangeDetector(BaseExtractor):
                             file_path=file_path,
                             raw_match=line
                         ))
-            except (json.JSONDecodeError, KeyError, ValueError):
+            except (KeyError, ValueError):
                 # Also handles cases where change_type_str is not a valid ChangeType
                 continue
         return results
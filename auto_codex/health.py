@@ -9,8 +9,9 @@ import asyncio
 import threading
 import time
 import uuid
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set, Callable, Any, Union
+from typing import Dict, List, Optional, Set, Callable, Any, Union, Iterable
 from enum import Enum
 from dataclasses import dataclass, field
 import logging
@@ -83,6 +84,11 @@ class AgentHealthInfo:
         """Check if agent is currently running."""
         return self.status in {AgentStatus.INITIALIZING, AgentStatus.RUNNING, AgentStatus.WAITING_APPROVAL}
     
+    @property
+    def is_finished(self) -> bool:
+        """Check if agent has reached a final status."""
+        return self.status in {AgentStatus.COMPLETED, AgentStatus.FAILED, AgentStatus.CANCELLED, AgentStatus.TIMEOUT}
+    
     @property
     def is_responsive(self) -> bool:
         """Check if agent is responsive based on recent heartbeat."""
@@ -262,6 +268,21 @@ class AgentHealthMonitor:
         with self._lock:
             return self._agents.get(agent_id)
     
+    def get_agents_health(self, agent_ids: Iterable[str]) -> Dict[str, AgentHealthInfo]:
+        """
+        Get health information for several agents under one lock acquisition.
+        
+        Args:
+            agent_ids: IDs of the agents to look up
+            
+        Returns:
+            Dictionary mapping each registered agent ID to its health info;
+            unknown IDs are left out
+        """
+        with self._lock:
+            agents = self._agents
+            return {agent_id: agents[agent_id] for agent_id in agent_ids if agent_id in agents}
+    
     def get_all_agents(self) -> Dict[str, AgentHealthInfo]:
         """
         Get health information for all monitored agents.
@@ -354,26 +375,22 @@ class AgentHealthMonitor:
             if total == 0:
                 return {"total": 0}
             
-            status_counts = {}
-            health_counts = {}
-            total_runtime = 0
+            status_counts = Counter()
+            health_counts = Counter()
+            total_runtime = 0.0
             total_errors = 0
             
+            # Count by status and health and accumulate metrics in one pass
             for agent in self._agents.values():
-                # Count by status
-                status_counts[agent.status.value] = status_counts.get(agent.status.value, 0) + 1
-                
-                # Count by health
-                health_counts[agent.health.value] = health_counts.get(agent.health.value, 0) + 1
-                
-                # Accumulate metrics
+                status_counts[agent.status.value] += 1
+                health_counts[agent.health.value] += 1
                 total_runtime += agent.runtime_seconds
                 total_errors += agent.metrics.error_count
             
             return {
                 "total": total,
-                "status_counts": status_counts,
-                "health_counts": health_counts,
+                "status_counts": dict(status_counts),
+                "health_counts": dict(health_counts),
                 "average_runtime": total_runtime / total if total > 0 else 0,
                 "total_errors": total_errors,
                 "healthy_percentage": (health_counts.get("healthy", 0) / total * 100) if total > 0 else 0
@@ -391,6 +408,24 @@ class AgentHealthMonitor:
         """Add a callback for errors."""
         self._error_callbacks.append(callback)
     
+    def remove_status_callback(self, callback: Callable[[str, AgentStatus], None]):
+        """Remove a status change callback; does nothing if it is not registered."""
+        with self._lock:
+            if callback in self._status_callbacks:
+                self._status_callbacks.remove(callback)
+    
+    def remove_health_callback(self, callback: Callable[[str, HealthStatus], None]):
+        """Remove a health change callback; does nothing if it is not registered."""
+        with self._lock:
+            if callback in self._health_callbacks:
+                self._health_callbacks.remove(callback)
+    
+    def remove_error_callback(self, callback: Callable[[str, str], None]):
+        """Remove an error callback; does nothing if it is not registered."""
+        with self._lock:
+            if callback in self._error_callbacks:
+                self._error_callbacks.remove(callback)
+    
     def _monitor_loop(self):
         """Main monitoring loop running in background thread."""
         while self._monitoring:
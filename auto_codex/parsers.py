@@ -5,16 +5,48 @@ Parser classes for handling Codex logs and output parsing.
 import os
 import glob
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from typing import Dict, List, Optional, Callable, Any
 from datetime import datetime
 
 from .models import CodexRunResult, ChangeType, ToolType, DiscoveredTool
 from .extractors import (
     BaseExtractor, PatchExtractor, CommandExtractor, 
-    ToolUsageExtractor, ChangeDetector, CustomExtractor, GenericToolExtractor
+    ToolUsageExtractor, ChangeDetector, CustomExtractor, GenericToolExtractor,
+    parse_json_lines
 )
 
 
+def _extract_log_file(log_file: str,
+                      extractors: List[BaseExtractor],
+                      content_filter: Optional[Callable[[str], bool]] = None) -> List[Any]:
+    """
+    Read one log file and run every extractor over its content.
+    
+    Module-level so parse_logs can hand it to a process pool.
+    """
+    try:
+        with open(log_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        # Apply content filter if provided
+        if content_filter and not content_filter(content):
+            return []
+        
+        # Apply all extractors
+        results = []
+        for extractor in extractors:
+            extracted = extractor.extract(log_file, content)
+            if extracted:
+                results.extend(extracted)
+        return results
+    
+    except Exception as e:
+        print(f"Error processing log file {log_file}: {e}")
+        return []
+
+
 class CodexLogParser:
     """
     Enhanced parser for Codex log files with flexible extraction capabilities.
@@ -54,7 +86,8 @@ class CodexLogParser:
     def parse_logs(self, 
                   extractors: Optional[List[BaseExtractor]] = None,
                   file_filter: Optional[Callable[[str], bool]] = None,
-                  content_filter: Optional[Callable[[str], bool]] = None) -> List[Dict[str, Any]]:
+                  content_filter: Optional[Callable[[str], bool]] = None,
+                  max_workers: int = 1) -> List[Dict[str, Any]]:
         """
         Parse log files using provided extractors.
         
@@ -62,6 +95,10 @@ class CodexLogParser:
             extractors: List of extractor instances to use
             file_filter: Optional function to filter log files by name
             content_filter: Optional function to filter log content
+            max_workers: Number of processes to parse files with. Extraction is
+                CPU-bound, so values above 1 spread the files over a process
+                pool; the extractors and content_filter must then be picklable
+                (no lambdas or local functions)
             
         Returns:
             List of extracted items from all logs
@@ -72,33 +109,24 @@ class CodexLogParser:
         if extractors is None:
             extractors = self._default_extractors
         
-        all_results = []
+        # Apply file filter if provided
+        log_files = [log_file for log_file in self.log_files
+                     if not file_filter or file_filter(log_file)]
         
-        for log_file in self.log_files:
-            # Apply file filter if provided
-            if file_filter and not file_filter(log_file):
-                continue
-            
-            try:
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Apply content filter if provided
-                if content_filter and not content_filter(content):
-                    continue
-                
-                # Apply all extractors
-                for extractor in extractors:
-                    results = extractor.extract(log_file, content)
-                    if results:
-                        # Convert to dict format for backward compatibility
-                        for result in results:
-                            all_results.append(self._to_dict(result))
-            
-            except Exception as e:
-                print(f"Error processing log file {log_file}: {e}")
+        if max_workers > 1 and len(log_files) > 1:
+            # Hand each worker several files per task to keep pickling
+            # round-trips low; map keeps results in file order
+            chunksize = max(1, len(log_files) // (max_workers * 4))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                per_file = list(executor.map(_extract_log_file, log_files,
+                                             repeat(extractors), repeat(content_filter),
+                                             chunksize=chunksize))
+        else:
+            per_file = [_extract_log_file(log_file, extractors, content_filter)
+                        for log_file in log_files]
         
-        return all_results
+        # Convert to dict format for backward compatibility
+        return [self._to_dict(result) for results in per_file for result in results]
     
     def get_patches(self) -> List[Dict[str, Any]]:
         """Convenience method to get all patches from logs."""
@@ -141,16 +169,17 @@ class CodexLogParser:
                 log_file=log_file
             )
         
-        # Extract using all extractors
+        # Extract using all extractors, decoding the JSON lines once for all four
         patch_extractor = PatchExtractor()
         command_extractor = CommandExtractor()
         tool_extractor = ToolUsageExtractor()
         change_extractor = ChangeDetector()
         
-        patches = patch_extractor.extract(log_file, content)
-        commands = command_extractor.extract(log_file, content)
-        tool_usage = tool_extractor.extract(log_file, content)
-        changes = change_extractor.extract(log_file, content)
+        entries = parse_json_lines(content)
+        patches = patch_extractor.extract_entries(log_file, entries)
+        commands = command_extractor.extract_entries(log_file, entries)
+        tool_usage = tool_extractor.extract_entries(log_file, entries)
+        changes = change_extractor.extract_entries(log_file, entries)
         
         # Determine start time (try to extract from log or use file modification time)
         start_time = self._extract_start_time(content, log_file)
@@ -274,6 +303,14 @@ class CodexOutputParser:
     def __init__(self):
         """Initialize the output parser."""
         self.diff_pattern = re.compile(r'^(--- a/.*?\n\+\+\+ b/.*?$)', re.MULTILINE)
+        # Patterns for detecting edit suggestions
+        self.edit_patterns = [
+            re.compile(pattern, re.IGNORECASE) for pattern in (
+                r'edit_file.*?target_file["\']:\s*["\']([^"\']+)["\']',
+                r'suggested.*?edit.*?file[:\s]+([^\s\n]+)',
+                r'modify.*?file[:\s]+([^\s\n]+)',
+            )
+        ]
     
     def parse_diff(self, diff_content: str) -> Dict[str, Any]:
         """
@@ -339,21 +376,18 @@ class CodexOutputParser:
         """
         edits = []
         
-        # Pattern for detecting edit suggestions
-        edit_patterns = [
-            r'edit_file.*?target_file["\']:\s*["\']([^"\']+)["\']',
-            r'suggested.*?edit.*?file[:\s]+([^\s\n]+)',
-            r'modify.*?file[:\s]+([^\s\n]+)',
-        ]
-        
-        for pattern in edit_patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
+        for pattern in self.edit_patterns:
+            # Matches come in order, so count newlines only since the last one
+            # rather than rescanning the content from the start for each match
+            line_number, pos = 1, 0
+            for match in pattern.finditer(content):
+                line_number += content.count('\n', pos, match.start())
+                pos = match.start()
                 edits.append({
                     'type': 'edit_suggestion',
                     'file_path': match.group(1),
                     'context': match.group(0),
-                    'line_number': content[:match.start()].count('\n') + 1
+                    'line_number': line_number
                 })
         
         return edits 
\ No newline at end of file
@@ -1,3 +1,3 @@
-from .base_benchmark import BaseBenchmark, BenchmarkTest, run_benchmark_cli
+from .base_benchmark import BaseBenchmark, BenchmarkTest, BenchmarkResult, run_benchmark_cli
 from .leetcode_easy_benchmark import LeetCodeEasyBenchmark
 from .leetcode_medium_benchmark import LeetCodeMediumBenchmark
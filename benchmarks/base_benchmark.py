@@ -6,23 +6,83 @@ Provides a base framework for creating coding benchmarks that can be extended
 for different types of challenges (LeetCode, HackerRank, custom problems, etc.)
 """
 
+import io
+import json
 import os
+import subprocess
 import sys
-import importlib.util
 import tempfile
 import shutil
 import traceback
 import time
+import threading
 import argparse
+import copy
+import operator
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from types import CodeType
+from typing import List, Dict, Any, Tuple, Optional, Callable, Set, TextIO
 from auto_codex.core import CodexRun
 from dotenv import load_dotenv
 
+RUNTIMES = ('cpython', 'pypy', 'numba')
+
+# Executed by the PyPy interpreter: loads the candidate, reports whether the
+# function is usable, then streams one JSON line per test case. The candidate's
+# own prints go to stderr so only protocol lines reach stdout.
+_SUBPROCESS_RUNNER = """
+import json, sys
+protocol = sys.stdout
+sys.stdout = sys.stderr
+def send(message):
+    protocol.write(json.dumps(message) + '\\n')
+    protocol.flush()
+request = json.load(sys.stdin)
+namespace = {'__name__': 'candidate', '__file__': request['path']}
+try:
+    with open(request['path'], 'rb') as f:
+        exec(compile(f.read(), request['path'], 'exec'), namespace)
+except Exception as e:
+    send({'import_error': str(e)})
+    sys.exit(0)
+func = namespace.get(request['function'])
+send({'found': func is not None, 'callable': callable(func)})
+if not callable(func):
+    sys.exit(0)
+for args in request['cases']:
+    try:
+        result = func(*args)
+    except Exception as e:
+        send({'error': str(e)})
+        continue
+    try:
+        send({'result': result})
+    except (TypeError, ValueError) as e:
+        send({'error': f'result is not JSON-serializable: {e}'})
+"""
+
+
+# Values a candidate cannot mutate, so they are safe to pass without copying
+_IMMUTABLE_TYPES = (str, bytes, int, float, complex, bool, type(None))
+
+
+def is_immutable(value: Any) -> bool:
+    """Check whether a value is built only from immutable scalars and tuples"""
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return True
+    if isinstance(value, (tuple, frozenset)):
+        return all(is_immutable(item) for item in value)
+    return False
+
 
 class BenchmarkTest:
     """Generic test case for any coding benchmark"""
     
+    __slots__ = ('name', 'problem_id', 'task_description', 'filename', 'function_name',
+                 'test_cases', 'immutable_inputs', 'helper_statement', 'parallel_cases')
+    
     def __init__(self, 
                  name: str,
                  problem_id: str,
@@ -30,7 +90,8 @@ class BenchmarkTest:
                  filename: str,
                  function_name: str,
                  test_cases: List[Tuple],
-                 helper_statement: str = None):
+                 helper_statement: str = None,
+                 parallel_cases: bool = False):
         """
         Initialize a benchmark test case.
         
@@ -42,23 +103,195 @@ class BenchmarkTest:
             function_name: Expected function name to implement
             test_cases: List of (inputs, expected_output) tuples
             helper_statement: Environmental hints for the agent
+            parallel_cases: Run test cases concurrently in threads (only worth it
+                for I/O-bound candidates; CPU-bound code is serialized by the GIL)
         """
         self.name = name
         self.problem_id = problem_id
         self.task_description = task_description
         self.filename = filename
         self.function_name = function_name
-        self.test_cases = test_cases
+        self.test_cases = tuple(test_cases)
+        # Per-case flag: True when the inputs need no defensive copy
+        self.immutable_inputs = tuple(is_immutable(inputs) for inputs, _ in self.test_cases)
         self.helper_statement = helper_statement or "The apply_patch method with 'Add File' syntax works reliably in sandboxed environments for creating new files."
+        self.parallel_cases = parallel_cases
+
+
+@dataclass
+class BenchmarkResult:
+    """Outcome of running one BenchmarkTest against one model"""
+    test: BenchmarkTest
+    file_created: bool = False
+    function_exists: bool = False
+    input_output_correct: bool = False
+    functionality_works: bool = False
+    execution_time: float = 0.0
+    error_message: Optional[str] = None
+    attempts_used: int = 0
+
+
+def summarize_results(results: List[BenchmarkResult]) -> Dict[str, Any]:
+    """
+    Aggregate a model's results in a single pass.
+    
+    Returns:
+        Dictionary with the test count, per-metric pass counts, and the
+        average execution time and attempts
+    """
+    file_created = function_exists = io_correct = functionality = attempts = 0
+    total_time = 0.0
+    for result in results:
+        file_created += result.file_created
+        function_exists += result.function_exists
+        io_correct += result.input_output_correct
+        functionality += result.functionality_works
+        total_time += result.execution_time
+        attempts += result.attempts_used
+    
+    total = len(results)
+    return {
+        'total': total,
+        'file_created': file_created,
+        'function_exists': function_exists,
+        'io_correct': io_correct,
+        'functionality': functionality,
+        'avg_time': total_time / total if total else 0.0,
+        'avg_attempts': attempts / total if total else 0.0
+    }
+
+
+def run_test_cases(func: Callable,
+                   test_cases: List[Tuple],
+                   compare: Callable[[Any, Any], bool],
+                   immutable_inputs: Optional[Tuple[bool, ...]] = None) -> Tuple[int, Any, Optional[Exception]]:
+    """
+    Drive every test case through a candidate function in one call.
+    
+    Inputs are deep-copied before each call so candidates that mutate their
+    arguments in place cannot corrupt the shared test suite.
+    
+    Args:
+        func: Candidate function under test
+        test_cases: List of (inputs, expected_output) tuples
+        compare: Callable deciding whether actual matches expected
+        immutable_inputs: Optional per-case flags; cases flagged True are
+            passed through without the deep copy
         
-        # Results tracking
-        self.file_created = False
-        self.function_exists = False
-        self.input_output_correct = False
-        self.functionality_works = False
-        self.execution_time = 0
-        self.error_message = None
-        self.attempts_used = 0
+    Returns:
+        (index, result, error) for the first failing case, where error is the
+        exception raised by the candidate (if any), or (-1, None, None) when
+        every case passes
+    """
+    # Bind the hot attribute lookup locally: LOAD_FAST instead of LOAD_GLOBAL/LOAD_ATTR per case
+    deepcopy = copy.deepcopy
+    if immutable_inputs is None:
+        immutable_inputs = (False,) * len(test_cases)
+    for index, ((inputs, expected), immutable) in enumerate(zip(test_cases, immutable_inputs)):
+        try:
+            args = inputs if immutable else deepcopy(inputs)
+            result = func(*args) if isinstance(args, tuple) else func(args)
+        except Exception as e:
+            return index, None, e
+        
+        if not compare(result, expected):
+            return index, result, None
+    
+    return -1, None, None
+
+
+def _call_case(func: Callable, inputs: Any) -> Any:
+    """Call a candidate with a private copy of one test case's inputs"""
+    args = copy.deepcopy(inputs)
+    if isinstance(args, tuple):
+        return func(*args)
+    return func(args)
+
+
+def run_test_cases_parallel(func: Callable,
+                            test_cases: List[Tuple],
+                            compare: Callable[[Any, Any], bool],
+                            max_workers: int = 8) -> Tuple[int, Any, Optional[Exception]]:
+    """
+    Thread-pooled variant of run_test_cases for I/O-bound candidates.
+    
+    Results are checked in case order, so the reported failure is the same
+    one run_test_cases would report; cases that have not started yet are
+    cancelled once a failure is found.
+    """
+    if not test_cases:
+        return -1, None, None
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(test_cases))) as executor:
+        futures = [executor.submit(_call_case, func, inputs) for inputs, _ in test_cases]
+        for index, future in enumerate(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                failure = (index, None, e)
+            else:
+                if compare(result, test_cases[index][1]):
+                    continue
+                failure = (index, result, None)
+            
+            for pending in futures[index + 1:]:
+                pending.cancel()
+            return failure
+    
+    return -1, None, None
+
+
+def _json_normalize(value: Any) -> Any:
+    """Return value as it looks after a JSON round-trip (tuples become lists)"""
+    try:
+        return json.loads(json.dumps(value))
+    except (TypeError, ValueError):
+        return value
+
+
+def jit_compile(func: Callable) -> Callable:
+    """
+    Wrap a candidate with numba.njit, falling back to the plain function.
+    
+    numba is imported here rather than at module load, so only the 'numba'
+    runtime pays for it. Compilation is lazy in numba, so typing failures
+    surface on the first call; the wrapper catches those and permanently
+    switches to CPython.
+    """
+    try:
+        import numba
+    except ImportError:
+        return func
+    
+    try:
+        jitted = numba.njit(func)
+    except Exception:
+        return func
+    
+    state = {'impl': jitted}
+    
+    def call(*args):
+        if state['impl'] is jitted:
+            try:
+                return jitted(*args)
+            except numba.core.errors.NumbaError:
+                state['impl'] = func
+        return state['impl'](*args)
+    
+    return call
+
+
+def find_pypy() -> Optional[str]:
+    """Locate a PyPy interpreter via the PYPY environment variable or PATH"""
+    return os.environ.get('PYPY') or shutil.which('pypy3') or shutil.which('pypy')
+
+
+def default_tmp_dir() -> Optional[str]:
+    """Return /dev/shm when it is a writable tmpfs, otherwise None (the system default)"""
+    shm = '/dev/shm'
+    if os.path.isdir(shm) and os.access(shm, os.W_OK):
+        return shm
+    return None
 
 
 class BaseBenchmark(ABC):
@@ -67,7 +300,11 @@ class BaseBenchmark(ABC):
     def __init__(self, 
                  benchmark_name: str,
                  models: Optional[List[str]] = None, 
-                 timeout: int = 300):
+                 timeout: int = 300,
+                 batch_size: int = 1,
+                 tmp_dir: Optional[str] = None,
+                 runtime: str = 'cpython',
+                 max_workers: int = 1):
         """
         Initialize the benchmark.
         
@@ -75,12 +312,35 @@ class BaseBenchmark(ABC):
             benchmark_name: Name of this benchmark
             models: List of model names to test
             timeout: Timeout in seconds for each test
+            batch_size: Number of problems sent to the agent in a single run
+            tmp_dir: Parent directory for per-test working directories
+                (defaults to a RAM-backed filesystem when available)
+            runtime: How candidates are executed: 'cpython' (in-process),
+                'pypy' (PyPy subprocess) or 'numba' (njit, when installed).
+                Under 'pypy' inputs and results cross a JSON boundary, so both
+                must be JSON-serializable; tuples arrive as lists and results
+                are compared against the JSON-normalized expected value
+            max_workers: Number of tests (or batches) run concurrently per model
         """
+        if runtime not in RUNTIMES:
+            raise ValueError(f"Unsupported runtime: {runtime}. Supported runtimes: {list(RUNTIMES)}")
         self.benchmark_name = benchmark_name
         self.models = models or ['gpt-4.1-mini']
         self.timeout = timeout
+        self.batch_size = max(1, batch_size)
+        self.tmp_dir = tmp_dir or default_tmp_dir()
+        self.runtime = runtime
+        self.max_workers = max(1, max_workers)
+        self.pypy = find_pypy() if runtime == 'pypy' else None
+        if runtime == 'pypy' and not self.pypy:
+            print("⚠️  Warning: PyPy interpreter not found; running candidates under CPython.")
         self.debug = True
         self.all_results = {}
+        self._compile_cache: Dict[str, Tuple[int, CodeType]] = {}
+        self._validated_providers: Set[str] = set()
+        self._output_lock = threading.Lock()
+        self._prompts: Dict[str, str] = {}
+        self._comparators: Dict[str, Callable[[Any, Any], bool]] = {}
     
     @abstractmethod
     def create_test_suite(self) -> List[BenchmarkTest]:
@@ -92,12 +352,18 @@ class BaseBenchmark(ABC):
         """Get the initial prompt that describes the benchmark environment"""
         pass
     
+    def prepare_prompts(self, tests: List[BenchmarkTest]):
+        """Build the full prompt for each test, fetching the benchmark prompt only once"""
+        prompt_prefix = self.get_benchmark_prompt()
+        for test in tests:
+            self._prompts[test.problem_id] = f"{prompt_prefix}\n\n{test.task_description}\n\nHINT: {test.helper_statement}"
+    
     def run_single_test(self, 
                        test: BenchmarkTest, 
                        test_dir: str, 
                        model: str, 
                        provider: str = 'openai', 
-                       max_attempts: int = 3) -> BenchmarkTest:
+                       max_attempts: int = 3) -> BenchmarkResult:
         """
         Run a single test case.
         
@@ -109,24 +375,31 @@ class BaseBenchmark(ABC):
             max_attempts: Maximum number of attempts
             
         Returns:
-            Updated test object with results
+            Result of the test for this model
         """
+        # Debug output is buffered and written in one go when the test ends
+        log = io.StringIO()
         if self.debug:
-            print(f"\n{'='*60}")
-            print(f"Running Test: {test.name} (Problem {test.problem_id})")
-            print(f"Model: {model}")
-            print(f"{'='*60}")
+            print(f"\n{'='*60}", file=log)
+            print(f"Running Test: {test.name} (Problem {test.problem_id})", file=log)
+            print(f"Model: {model}", file=log)
+            print(f"{'='*60}", file=log)
         
         start_time = time.time()
         
-        # Construct full prompt
-        full_prompt = f"{self.get_benchmark_prompt()}\n\n{test.task_description}\n\nHINT: {test.helper_statement}"
+        result = BenchmarkResult(test)
+        if test.problem_id not in self._prompts:
+            self.prepare_prompts([test])
+        full_prompt = self._prompts[test.problem_id]
+        
+        # Provider configuration only needs checking once per benchmark
+        validate_env = provider not in self._validated_providers
         
         for attempt in range(max_attempts):
-            test.attempts_used = attempt + 1
+            result.attempts_used = attempt + 1
             
             if self.debug:
-                print(f"\nAttempt {attempt + 1}/{max_attempts}")
+                print(f"\nAttempt {attempt + 1}/{max_attempts}", file=log)
             
             try:
                 # Create CodexRun
@@ -136,142 +409,340 @@ class BaseBenchmark(ABC):
                     provider=provider,
                     writable_root=test_dir,
                     timeout=self.timeout,
-                    debug=self.debug
+                    debug=self.debug,
+                    validate_env=validate_env
                 )
+                self._validated_providers.add(provider)
+                validate_env = False
                 
                 # Execute the run
-                result = run.execute()
+                run_result = run.execute()
                 
                 if self.debug:
-                    print(f"Run completed. Success: {result.success}")
+                    print(f"Run completed. Success: {run_result.success}", file=log)
                 
                 # Test the implementation
-                if self.test_implementation(test, test_dir):
+                if self.test_implementation(result, test_dir):
                     break
                     
             except Exception as e:
-                test.error_message = str(e)
+                result.error_message = str(e)
                 if self.debug:
-                    print(f"Error in attempt {attempt + 1}: {e}")
-                    traceback.print_exc()
+                    print(f"Error in attempt {attempt + 1}: {e}", file=log)
+                    traceback.print_exc(file=log)
         
-        test.execution_time = time.time() - start_time
+        result.execution_time = time.time() - start_time
         
         if self.debug:
-            self.print_test_results(test)
+            self.print_test_results(result, file=log)
+        self._flush_log(log)
         
-        return test
+        return result
+    
+    def get_batch_prompt(self, tests: List[BenchmarkTest]) -> str:
+        """Build a single prompt asking the agent to solve several problems at once"""
+        sections = [self.get_benchmark_prompt(),
+                    f"Solve all {len(tests)} problems below. Create every file in the same directory."]
+        for i, test in enumerate(tests, 1):
+            sections.append(f"### Problem {i}: {test.name}\n\n{test.task_description}")
+        sections.append(f"HINT: {tests[0].helper_statement}")
+        return "\n\n".join(sections)
     
-    def test_implementation(self, test: BenchmarkTest, test_dir: str) -> bool:
+    def run_batch(self,
+                  tests: List[BenchmarkTest],
+                  test_dir: str,
+                  model: str,
+                  provider: str = 'openai',
+                  max_attempts: int = 3) -> List[BenchmarkResult]:
+        """
+        Run several tests through a single agent run per attempt.
+        
+        Each attempt only re-prompts for the tests that are still failing.
+        
+        Args:
+            tests: The test cases to run together
+            test_dir: Shared directory the agent writes all solutions to
+            model: Model name to use
+            provider: AI provider to use
+            max_attempts: Maximum number of attempts
+            
+        Returns:
+            Results of the tests for this model, in input order
+        """
+        log = io.StringIO()
+        if self.debug:
+            print(f"\n{'='*60}", file=log)
+            print(f"Running Batch: {', '.join(test.name for test in tests)}", file=log)
+            print(f"Model: {model}", file=log)
+            print(f"{'='*60}", file=log)
+        
+        start_time = time.time()
+        results = [BenchmarkResult(test) for test in tests]
+        pending = list(results)
+        validate_env = provider not in self._validated_providers
+        
+        for attempt in range(max_attempts):
+            for result in pending:
+                result.attempts_used = attempt + 1
+            
+            if self.debug:
+                print(f"\nAttempt {attempt + 1}/{max_attempts} ({len(pending)} problem(s))", file=log)
+            
+            try:
+                run = CodexRun(
+                    prompt=self.get_batch_prompt([result.test for result in pending]),
+                    model=model,
+                    provider=provider,
+                    writable_root=test_dir,
+                    timeout=self.timeout,
+                    debug=self.debug,
+                    validate_env=validate_env
+                )
+                self._validated_providers.add(provider)
+                validate_env = False
+                
+                run_result = run.execute()
+                
+                if self.debug:
+                    print(f"Run completed. Success: {run_result.success}", file=log)
+                
+            except Exception as e:
+                for result in pending:
+                    result.error_message = str(e)
+                if self.debug:
+                    print(f"Error in attempt {attempt + 1}: {e}", file=log)
+                    traceback.print_exc(file=log)
+                continue
+            
+            pending = [result for result in pending if not self.test_implementation(result, test_dir)]
+            if not pending:
+                break
+        
+        execution_time = time.time() - start_time
+        for result in results:
+            result.execution_time = execution_time
+            if self.debug:
+                self.print_test_results(result, file=log)
+        self._flush_log(log)
+        
+        return results
+    
+    def _flush_log(self, log: io.StringIO):
+        """Write a buffered debug log to stdout as one contiguous block"""
+        output = log.getvalue()
+        if output:
+            with self._output_lock:
+                sys.stdout.write(output)
+                sys.stdout.flush()
+    
+    def test_implementation(self, result: BenchmarkResult, test_dir: str) -> bool:
         """
         Test if the implementation works correctly.
         
         Args:
-            test: The test case
+            result: Result record for the test case, updated in place
             test_dir: Directory containing the implementation
             
         Returns:
             True if all tests pass, False otherwise
         """
+        test = result.test
         file_path = os.path.join(test_dir, test.filename)
         
-        # Check if file was created
-        test.file_created = os.path.exists(file_path)
-        if not test.file_created:
-            test.error_message = f"File {test.filename} was not created"
+        # Check if file was created; the stat result also keys the compile cache
+        try:
+            mtime = os.stat(file_path).st_mtime_ns
+        except OSError:
+            result.file_created = False
+            result.error_message = f"File {test.filename} was not created"
             return False
+        result.file_created = True
         
-        # Check function implementation
-        if not self.test_function_implementation(test, file_path):
-            return False
+        # Check function implementation and functionality
+        return self._probe_candidate(result, file_path, mtime)
+    
+    def _load(self, file_path: str, mtime: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Execute a candidate file in a fresh namespace.
         
-        # Test functionality
-        return self.test_function_correctness(test, file_path)
+        The compiled code object is cached per path and reused until the
+        file's mtime changes, so retries only recompile when the agent
+        actually rewrote the file. Callers that already stat'ed the file
+        can pass its st_mtime_ns to skip a second stat.
+        """
+        if mtime is None:
+            mtime = os.stat(file_path).st_mtime_ns
+        entry = self._compile_cache.get(file_path)
+        if entry is not None and entry[0] == mtime:
+            code = entry[1]
+        else:
+            with open(file_path, 'rb') as f:
+                code = compile(f.read(), file_path, 'exec')
+            self._compile_cache[file_path] = (mtime, code)
+        
+        namespace = {'__name__': 'candidate', '__file__': file_path}
+        exec(code, namespace)
+        return namespace
     
-    def test_function_implementation(self, test: BenchmarkTest, file_path: str) -> bool:
-        """Test if the function exists and is callable"""
+    def _probe_candidate(self, result: BenchmarkResult, file_path: str,
+                         mtime: Optional[int] = None) -> bool:
+        """Load the candidate once, check the function is callable, then run every test case"""
+        if self.pypy:
+            return self._probe_candidate_subprocess(result, file_path)
+        
+        test = result.test
+        try:
+            namespace = self._load(file_path, mtime)
+        except Exception as e:
+            result.error_message = f"Error importing {test.filename}: {str(e)}"
+            return False
+        
+        if test.function_name not in namespace:
+            result.error_message = f"Function '{test.function_name}' not found in {test.filename}"
+            return False
+        
+        func = namespace[test.function_name]
+        if not callable(func):
+            result.error_message = f"'{test.function_name}' exists but is not callable"
+            return False
+        result.function_exists = True
+        if self.runtime == 'numba':
+            func = jit_compile(func)
+        
         try:
-            spec = importlib.util.spec_from_file_location("test_module", file_path)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            # Test all test cases in a single driver call
+            comparator = self._comparators.get(test.problem_id)
+            if comparator is None:
+                comparator = self._comparators[test.problem_id] = self.make_comparator(test)
+            if test.parallel_cases:
+                index, actual, error = run_test_cases_parallel(func, test.test_cases, comparator)
+            else:
+                index, actual, error = run_test_cases(func, test.test_cases, comparator,
+                                                      test.immutable_inputs)
+            if index < 0:
+                result.input_output_correct = True
+                result.functionality_works = True
+                return True
             
-            if hasattr(module, test.function_name):
-                func = getattr(module, test.function_name)
-                if callable(func):
-                    test.function_exists = True
-                    return True
-                else:
-                    test.error_message = f"'{test.function_name}' exists but is not callable"
+            inputs, expected = test.test_cases[index]
+            if error is not None:
+                result.error_message = f"Runtime error with input {inputs}: {str(error)}"
             else:
-                test.error_message = f"Function '{test.function_name}' not found in {test.filename}"
+                result.error_message = f"Test failed: input {inputs}, expected {expected}, got {actual}"
             
         except Exception as e:
-            test.error_message = f"Error importing {test.filename}: {str(e)}"
+            result.error_message = f"Error testing function: {str(e)}"
         
         return False
     
-    def test_function_correctness(self, test: BenchmarkTest, file_path: str) -> bool:
-        """Test if the function produces correct outputs"""
+    def _probe_candidate_subprocess(self, result: BenchmarkResult, file_path: str) -> bool:
+        """
+        Run the candidate and its test cases under the PyPy interpreter.
+        
+        Results come back as JSON, so each expected value is put through the
+        same round-trip before comparison: a tuple result matches a tuple
+        expected value (both become lists) as it would in-process.
+        """
+        test = result.test
         try:
-            spec = importlib.util.spec_from_file_location("test_module", file_path)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            
-            func = getattr(module, test.function_name)
-            
-            # Test all test cases
-            passed_tests = 0
-            for inputs, expected in test.test_cases:
-                try:
-                    if isinstance(inputs, tuple):
-                        result = func(*inputs)
-                    else:
-                        result = func(inputs)
-                    
-                    if self.compare_results(result, expected):
-                        passed_tests += 1
-                    else:
-                        test.error_message = f"Test failed: input {inputs}, expected {expected}, got {result}"
-                        break
-                        
-                except Exception as e:
-                    test.error_message = f"Runtime error with input {inputs}: {str(e)}"
-                    break
-            
-            if passed_tests == len(test.test_cases):
-                test.input_output_correct = True
-                test.functionality_works = True
-                return True
-            
+            cases = [list(inputs) if isinstance(inputs, tuple) else [inputs]
+                     for inputs, _ in test.test_cases]
+            request = json.dumps({'path': file_path, 'function': test.function_name, 'cases': cases})
+            proc = subprocess.run([self.pypy, '-c', _SUBPROCESS_RUNNER], input=request,
+                                  capture_output=True, text=True, timeout=self.timeout)
+            lines = [json.loads(line) for line in proc.stdout.splitlines()]
         except Exception as e:
-            test.error_message = f"Error testing function: {str(e)}"
+            result.error_message = f"Error running {test.filename} under PyPy: {str(e)}"
+            return False
         
-        return False
+        if not lines:
+            result.error_message = f"Error running {test.filename} under PyPy: {proc.stderr.strip()}"
+            return False
+        header = lines[0]
+        if 'import_error' in header:
+            result.error_message = f"Error importing {test.filename}: {header['import_error']}"
+            return False
+        if not header['found']:
+            result.error_message = f"Function '{test.function_name}' not found in {test.filename}"
+            return False
+        if not header['callable']:
+            result.error_message = f"'{test.function_name}' exists but is not callable"
+            return False
+        result.function_exists = True
+        
+        comparator = self._comparators.get(test.problem_id)
+        if comparator is None:
+            comparator = self._comparators[test.problem_id] = self.make_comparator(test)
+        outcomes = lines[1:]
+        num_outcomes = len(outcomes)
+        for index, (inputs, expected) in enumerate(test.test_cases):
+            if index >= num_outcomes:
+                result.error_message = f"Runtime error with input {inputs}: {proc.stderr.strip()}"
+                return False
+            outcome = outcomes[index]
+            if 'error' in outcome:
+                result.error_message = f"Runtime error with input {inputs}: {outcome['error']}"
+                return False
+            if not comparator(outcome['result'], _json_normalize(expected)):
+                result.error_message = f"Test failed: input {inputs}, expected {expected}, got {outcome['result']}"
+                return False
+        
+        result.input_output_correct = True
+        result.functionality_works = True
+        return True
     
     def compare_results(self, actual: Any, expected: Any) -> bool:
         """Compare actual and expected results (can be overridden for custom comparison)"""
         return actual == expected
     
-    def run_all_tests(self) -> Dict[str, List[BenchmarkTest]]:
+    def make_comparator(self, test: BenchmarkTest) -> Callable[[Any, Any], bool]:
+        """
+        Pick the comparison function used for every case of a test.
+        
+        Plain equality is resolved to operator.eq up front; benchmarks that
+        override compare_results keep their bound method. Subclasses may
+        override this to specialize further per test.
+        """
+        if type(self).compare_results is BaseBenchmark.compare_results:
+            return operator.eq
+        return self.compare_results
+    
+    def run_all_tests(self) -> Dict[str, List[BenchmarkResult]]:
         """Run all tests for all models"""
         test_suite = self.create_test_suite()
+        self.prepare_prompts(test_suite)
         
         print(f"\n{'='*80}")
         print(f"{self.benchmark_name} Benchmark")
         print(f"Testing {len(test_suite)} problems with {len(self.models)} model(s)")
         print(f"{'='*80}")
         
+        if self.batch_size > 1:
+            units = [test_suite[start:start + self.batch_size]
+                     for start in range(0, len(test_suite), self.batch_size)]
+        else:
+            units = test_suite
+        
         for model in self.models:
             print(f"\n🤖 Testing model: {model}")
             model_results = []
             
-            for i, test in enumerate(test_suite, 1):
-                print(f"\n📝 Test {i}/{len(test_suite)}: {test.name}")
-                
-                # Create temporary directory for this test
-                with tempfile.TemporaryDirectory() as test_dir:
-                    result = self.run_single_test(test, test_dir, model)
-                    model_results.append(result)
+            if self.max_workers > 1 and units:
+                # Each unit is mostly spent waiting on the agent subprocess, so
+                # threads overlap them; map() keeps results in suite order
+                print(f"\n📝 Running {len(units)} unit(s) with {self.max_workers} workers")
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(units))) as executor:
+                    for unit_results in executor.map(lambda unit: self._run_unit(unit, model), units):
+                        model_results.extend(unit_results)
+            else:
+                for unit in units:
+                    done = len(model_results)
+                    if self.batch_size > 1:
+                        print(f"\n📝 Tests {done + 1}-{done + len(unit)}/{len(test_suite)}: "
+                              f"{', '.join(test.name for test in unit)}")
+                    else:
+                        print(f"\n📝 Test {done + 1}/{len(test_suite)}: {unit.name}")
+                    model_results.extend(self._run_unit(unit, model))
             
             self.all_results[model] = model_results
             self.print_model_summary(model, model_results)
@@ -279,27 +750,36 @@ class BaseBenchmark(ABC):
         self.print_comparative_summary()
         return self.all_results
     
-    def print_test_results(self, test: BenchmarkTest):
+    def _run_unit(self, unit, model: str) -> List[BenchmarkResult]:
+        """Run one test, or one batch of tests, in its own temporary directory"""
+        with tempfile.TemporaryDirectory(dir=self.tmp_dir) as test_dir:
+            if isinstance(unit, list):
+                return self.run_batch(unit, test_dir, model)
+            return [self.run_single_test(unit, test_dir, model)]
+    
+    def print_test_results(self, result: BenchmarkResult, file: Optional[TextIO] = None):
         """Print results for a single test"""
-        print(f"\nTest Results for {test.name}:")
-        print(f"  ✅ File Created: {test.file_created}")
-        print(f"  ✅ Function Exists: {test.function_exists}")
-        print(f"  ✅ I/O Correct: {test.input_output_correct}")
-        print(f"  ✅ Functionality: {test.functionality_works}")
-        print(f"  ⏱️  Execution Time: {test.execution_time:.2f}s")
-        print(f"  🔄 Attempts Used: {test.attempts_used}")
-        if test.error_message:
-            print(f"  ❌ Error: {test.error_message}")
-    
-    def print_model_summary(self, model: str, results: List[BenchmarkTest]):
+        test = result.test
+        print(f"\nTest Results for {test.name}:", file=file)
+        print(f"  ✅ File Created: {result.file_created}", file=file)
+        print(f"  ✅ Function Exists: {result.function_exists}", file=file)
+        print(f"  ✅ I/O Correct: {result.input_output_correct}", file=file)
+        print(f"  ✅ Functionality: {result.functionality_works}", file=file)
+        print(f"  ⏱️  Execution Time: {result.execution_time:.2f}s", file=file)
+        print(f"  🔄 Attempts Used: {result.attempts_used}", file=file)
+        if result.error_message:
+            print(f"  ❌ Error: {result.error_message}", file=file)
+    
+    def print_model_summary(self, model: str, results: List[BenchmarkResult]):
         """Print summary for a single model"""
-        total_tests = len(results)
-        file_created = sum(1 for r in results if r.file_created)
-        function_exists = sum(1 for r in results if r.function_exists)
-        io_correct = sum(1 for r in results if r.input_output_correct)
-        functionality = sum(1 for r in results if r.functionality_works)
-        avg_time = sum(r.execution_time for r in results) / total_tests
-        avg_attempts = sum(r.attempts_used for r in results) / total_tests
+        summary = summarize_results(results)
+        total_tests = summary['total']
+        file_created = summary['file_created']
+        function_exists = summary['function_exists']
+        io_correct = summary['io_correct']
+        functionality = summary['functionality']
+        avg_time = summary['avg_time']
+        avg_attempts = summary['avg_attempts']
         
         print(f"\n📊 {model} Summary:")
         print(f"  File Creation: {file_created}/{total_tests} ({file_created/total_tests*100:.1f}%)")
@@ -322,14 +802,14 @@ class BaseBenchmark(ABC):
         print("-" * 80)
         
         for model in self.models:
-            results = self.all_results[model]
-            total = len(results)
-            files = sum(1 for r in results if r.file_created)
-            funcs = sum(1 for r in results if r.function_exists)
-            io = sum(1 for r in results if r.input_output_correct)
-            full = sum(1 for r in results if r.functionality_works)
-            avg_time = sum(r.execution_time for r in results) / total
-            avg_attempts = sum(r.attempts_used for r in results) / total
+            summary = summarize_results(self.all_results[model])
+            total = summary['total']
+            files = summary['file_created']
+            funcs = summary['function_exists']
+            io = summary['io_correct']
+            full = summary['functionality']
+            avg_time = summary['avg_time']
+            avg_attempts = summary['avg_attempts']
             
             print(f"{model:<20} {files}/{total:<6} {funcs}/{total:<8} {io}/{total:<6} {full}/{total:<6} {avg_time:<6.1f}s {avg_attempts:<6.1f}")
 
@@ -345,6 +825,14 @@ def create_cli_parser(benchmark_name: str) -> argparse.ArgumentParser:
                        help='Timeout in seconds per test (default: 300)')
     parser.add_argument('--max-attempts', type=int, default=3,
                        help='Maximum attempts per test (default: 3)')
+    parser.add_argument('--batch-size', type=int, default=1,
+                       help='Problems sent to the agent per run (default: 1)')
+    parser.add_argument('--tmp-dir', default=None,
+                       help='Parent directory for test working dirs (default: /dev/shm if writable)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Tests run concurrently per model (default: 1)')
+    parser.add_argument('--runtime', choices=RUNTIMES, default='cpython',
+                       help='How candidate solutions are executed (default: cpython)')
     parser.add_argument('--debug', action='store_true',
                        help='Enable debug output')
     return parser
@@ -365,11 +853,18 @@ def run_benchmark_cli(benchmark_class, benchmark_name: str):
     print(f"Provider: {args.provider}")
     print(f"Timeout: {args.timeout}s")
     print(f"Max Attempts: {args.max_attempts}")
+    print(f"Batch Size: {args.batch_size}")
+    print(f"Runtime: {args.runtime}")
+    print(f"Workers: {args.workers}")
     
     # Create and run benchmark
     benchmark = benchmark_class(
         models=args.models,
-        timeout=args.timeout
+        timeout=args.timeout,
+        batch_size=args.batch_size,
+        tmp_dir=args.tmp_dir,
+        runtime=args.runtime,
+        max_workers=args.workers
     )
     benchmark.debug = args.debug
     
@@ -8,23 +8,86 @@ Time Complexity: O(max(m, n))
 Space Complexity: O(max(m, n))
 """
 
+# Digit lists between these lengths are added as Python ints: the bytes/int
+# conversions and the add run in C, which beats the per-digit loop past ~16
+# digits. The upper bound stays under CPython's int/str conversion limit.
+BIGNUM_MIN_DIGITS = 16
+BIGNUM_MAX_DIGITS = 4000
+
+# Translation tables between digit values 0-9 and ASCII '0'-'9'
+_TO_ASCII = bytes.maketrans(bytes(range(10)), b'0123456789')
+_FROM_ASCII = bytes.maketrans(b'0123456789', bytes(range(10)))
+
 class ListNode:
     """Definition for singly-linked list."""
+    __slots__ = ('val', 'next')
+    
     def __init__(self, val=0, next=None):
         self.val = val
         self.next = next
 
+def add_digit_lists(digits1, digits2):
+    """
+    Add two numbers stored as flat lists of digits.
+    
+    Long inputs go through a single Python int addition; short ones are
+    ripple-carry added digit by digit.
+    
+    Args:
+        digits1: List of digits of the first number (reverse order)
+        digits2: List of digits of the second number (reverse order)
+        
+    Returns:
+        List of digits of the sum (reverse order)
+    """
+    width = max(len(digits1), len(digits2))
+    if BIGNUM_MIN_DIGITS <= width <= BIGNUM_MAX_DIGITS:
+        total = (int(bytes(digits1[::-1]).translate(_TO_ASCII) or b'0')
+                 + int(bytes(digits2[::-1]).translate(_TO_ASCII) or b'0'))
+        result = list(str(total).encode()[::-1].translate(_FROM_ASCII))
+        # Keep high-order zero digits, as the ripple-carry loop would
+        if len(result) < width:
+            result.extend([0] * (width - len(result)))
+        return result
+    
+    if len(digits1) < len(digits2):
+        digits1, digits2 = digits2, digits1
+    
+    result = []
+    append = result.append
+    carry = 0
+    
+    # Overlapping digits, then the tail of the longer number
+    for i, val2 in enumerate(digits2):
+        carry, digit = divmod(digits1[i] + val2 + carry, 10)
+        append(digit)
+    for val1 in digits1[len(digits2):]:
+        carry, digit = divmod(val1 + carry, 10)
+        append(digit)
+    
+    if carry:
+        append(carry)
+    return result
+
 def addTwoNumbers(l1, l2):
     """
     Add two numbers represented as linked lists.
     
+    The benchmark harness represents linked lists as plain Python lists, so
+    list inputs are added directly as flat digit arrays without building
+    any ListNode objects.
+    
     Args:
-        l1: ListNode representing first number (digits in reverse order)
-        l2: ListNode representing second number (digits in reverse order)
+        l1: ListNode (or list) representing first number (digits in reverse order)
+        l2: ListNode (or list) representing second number (digits in reverse order)
         
     Returns:
-        ListNode representing the sum (digits in reverse order)
+        ListNode representing the sum (digits in reverse order), or a list
+        when the inputs are lists
     """
+    if isinstance(l1, list) and isinstance(l2, list):
+        return add_digit_lists(l1, l2)
+    
     dummy = ListNode(0)  # Dummy node to simplify logic
     current = dummy
     carry = 0
@@ -20,27 +20,26 @@ def maxArea(height):
     Returns:
         Integer representing the maximum area
     """
-    if len(height) < 2:
-        return 0
-    
     left = 0
-    right = len(height) - 1
+    right = len(height) - 1  # Fewer than two lines gives right <= 0: no loop
     max_area = 0
     
     while left < right:
-        # Calculate current area
-        width = right - left
-        current_height = min(height[left], height[right])
-        current_area = width * current_height
-        
-        # Update maximum area
-        max_area = max(max_area, current_area)
+        # Read each end once; the shorter line bounds the area
+        left_height = height[left]
+        right_height = height[right]
         
         # Move the pointer with smaller height
         # This gives us the best chance to find a larger area
-        if height[left] < height[right]:
+        if left_height < right_height:
+            current_area = (right - left) * left_height
             left += 1
         else:
+            current_area = (right - left) * right_height
             right -= 1
+        
+        # Update maximum area (inline compare avoids a max() call per step)
+        if current_area > max_area:
+            max_area = current_area
     
     return max_area 
\ No newline at end of file
@@ -6,10 +6,14 @@ You can return the answer in any order.
 An Anagram is a word or phrase formed by rearranging the letters of a different word or phrase, 
 typically using all the original letters exactly once.
 
-Time Complexity: O(n * k * log k) where n is the number of strings and k is the maximum length of a string
+Constraints: strs[i] consists of lowercase English letters.
+
+Time Complexity: O(n * k) where n is the number of strings and k is the maximum length of a string
 Space Complexity: O(n * k)
 """
 
+from collections import defaultdict
+
 def groupAnagrams(strs):
     """
     Group anagrams together.
@@ -23,17 +27,26 @@ def groupAnagrams(strs):
     if not strs:
         return []
     
-    anagram_groups = {}
+    anagram_groups = defaultdict(list)
     
     for s in strs:
-        # Sort the string to create a key for anagrams
-        # All anagrams will have the same sorted string
-        sorted_str = ''.join(sorted(s))
+        if s.isascii() and s.isalpha() and s.islower():
+            # Count each letter to create a key for anagrams
+            # All anagrams have the same 26 letter counts, and counting is O(k)
+            # where sorting would be O(k log k)
+            counts = [0] * 26
+            for code in s.encode():
+                counts[code - 97] += 1
+            key = tuple(counts)
+        else:
+            # Outside a-z the counts would land in the wrong slots, so fall
+            # back to the sorted characters; such a string can never be an
+            # anagram of an all-lowercase one, so the two key kinds never mix
+            key = ''.join(sorted(s))
         
-        # Add the string to the appropriate group
-        if sorted_str not in anagram_groups:
-            anagram_groups[sorted_str] = []
-        anagram_groups[sorted_str].append(s)
+        # Add the string to the appropriate group; a new group's list is only
+        # created on a miss, unlike setdefault's throwaway [] per call
+        anagram_groups[key].append(s)
     
     # Return all groups as a list of lists
     return list(anagram_groups.values()) 
\ No newline at end of file
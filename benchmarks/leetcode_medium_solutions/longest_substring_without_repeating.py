@@ -3,7 +3,7 @@ LeetCode #3: Longest Substring Without Repeating Characters
 Given a string s, find the length of the longest substring without repeating characters.
 
 Time Complexity: O(n)
-Space Complexity: O(min(m, n)) where m is the size of the charset
+Space Complexity: O(m) where m is the size of the charset (128 for ASCII)
 """
 
 def lengthOfLongestSubstring(s):
@@ -19,21 +19,38 @@ def lengthOfLongestSubstring(s):
     if not s:
         return 0
     
-    char_index = {}  # Dictionary to store character and its latest index
+    # For ASCII input (the LeetCode charset) work on integer character codes:
+    # bytes indexing is C-level and the lookup table has only 128 slots.
+    # Other input keeps its characters, indexed through a dict instead
+    is_ascii = s.isascii()
+    codes = s.encode('ascii') if is_ascii else s
+    
+    # No window can be longer than the number of distinct characters, so the
+    # scan stops as soon as one reaches that bound (or skips it if all unique)
+    distinct = len(set(codes))
+    if distinct == len(codes):
+        return distinct
+    
+    # Latest index of each character; the dict is pre-filled with every
+    # character so both tables are indexed the same way below
+    last_index = [-1] * 128 if is_ascii else dict.fromkeys(codes, -1)
     max_length = 0
     start = 0  # Start of the current window
     
-    for end in range(len(s)):
-        char = s[end]
-        
-        # If character is already seen and is within current window
-        if char in char_index and char_index[char] >= start:
-            start = char_index[char] + 1
+    for end, code in enumerate(codes):
+        # If character was last seen within the current window, move past it
+        seen = last_index[code]
+        if seen >= start:
+            start = seen + 1
         
         # Update the character's latest index
-        char_index[char] = end
+        last_index[code] = end
         
         # Update max_length if current window is larger
-        max_length = max(max_length, end - start + 1)
+        length = end - start + 1
+        if length > max_length:
+            max_length = length
+            if length == distinct:
+                break
     
-    return max_length 
\ No newline at end of file
+    return max_length
@@ -7,9 +7,16 @@ The product of any prefix or suffix of nums is guaranteed to fit in a 32-bit int
 You must write an algorithm that runs in O(n) time and without using the division operation.
 
 Time Complexity: O(n)
-Space Complexity: O(1) excluding output array
+Space Complexity: O(n) for the prefix/suffix products
 """
 
+from itertools import accumulate
+from operator import mul
+
+# Below this length one fused Python loop beats setting up the accumulate()
+# iterators; above it the C-level passes win
+SMALL_ARRAY_SIZE = 32
+
 def productExceptSelf(nums):
     """
     Calculate product of array except self without using division.
@@ -21,18 +28,26 @@ def productExceptSelf(nums):
         List where each element is the product of all other elements
     """
     n = len(nums)
-    result = [1] * n
+    if n <= SMALL_ARRAY_SIZE:
+        # Fill prefix products from the front and suffix products from the
+        # back in the same pass
+        result = [1] * n
+        left = right = 1
+        for i in range(n):
+            j = n - 1 - i
+            result[i] *= left
+            result[j] *= right
+            left *= nums[i]
+            right *= nums[j]
+        return result
     
-    # First pass: calculate left products
-    # result[i] contains the product of all elements to the left of i
-    for i in range(1, n):
-        result[i] = result[i - 1] * nums[i - 1]
+    # Prefix products: left[i] is the product of all elements to the left of i.
+    # accumulate() runs the multiply loop in C instead of the interpreter.
+    left = accumulate(nums[:-1], mul, initial=1)
     
-    # Second pass: multiply by right products
-    # Use a variable to keep track of the product of elements to the right
-    right_product = 1
-    for i in range(n - 1, -1, -1):
-        result[i] *= right_product
-        right_product *= nums[i]
+    # Suffix products built the same way over the reversed tail, then flipped
+    # so right[i] is the product of all elements to the right of i
+    right = list(accumulate(nums[:0:-1], mul, initial=1))
+    right.reverse()
     
-    return result 
\ No newline at end of file
+    return list(map(mul, left, right))
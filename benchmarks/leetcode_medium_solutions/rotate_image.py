@@ -10,7 +10,10 @@ Space Complexity: O(1)
 
 def rotate(matrix):
     """
-    Rotate the matrix 90 degrees clockwise in-place.
+    Rotate the matrix 90 degrees clockwise in-place, one ring at a time.
+    
+    Each cell is read and written exactly once with O(1) extra space, so no
+    second matrix is allocated.
     
     Args:
         matrix: 2D list representing the image (modified in-place)
@@ -20,40 +23,18 @@ def rotate(matrix):
     """
     n = len(matrix)
     
-    # Step 1: Transpose the matrix (swap matrix[i][j] with matrix[j][i])
-    for i in range(n):
-        for j in range(i, n):
-            matrix[i][j], matrix[j][i] = matrix[j][i], matrix[i][j]
-    
-    # Step 2: Reverse each row
-    for i in range(n):
-        matrix[i].reverse()
-    
-    # Alternative approach: rotate layer by layer
-    # Uncomment below for the layer-by-layer approach
-    """
-    n = len(matrix)
-    
     # Process each layer (ring) of the matrix
-    for layer in range(n // 2):
-        first = layer
-        last = n - 1 - layer
+    for first in range(n // 2):
+        last = n - 1 - first
+        top_row = matrix[first]
+        bottom_row = matrix[last]
         
         for i in range(first, last):
-            offset = i - first
-            
-            # Save top element
-            top = matrix[first][i]
-            
-            # Top = Left
-            matrix[first][i] = matrix[last - offset][first]
-            
-            # Left = Bottom
-            matrix[last - offset][first] = matrix[last][last - offset]
-            
-            # Bottom = Right
-            matrix[last][last - offset] = matrix[i][last]
+            opposite = last - (i - first)
             
-            # Right = Top
+            # Four-way cycle: left -> top -> right -> bottom -> left
+            top = top_row[i]
+            top_row[i] = matrix[opposite][first]
+            matrix[opposite][first] = bottom_row[opposite]
+            bottom_row[opposite] = matrix[i][last]
             matrix[i][last] = top
-    """ 
\ No newline at end of file
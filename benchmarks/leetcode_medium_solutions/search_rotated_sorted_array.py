@@ -12,6 +12,9 @@ Time Complexity: O(log n)
 Space Complexity: O(1)
 """
 
+# Below this length a C-level linear scan beats the Python binary-search loop
+SMALL_ARRAY_SIZE = 16
+
 def search(nums, target):
     """
     Search for target in a rotated sorted array.
@@ -23,30 +26,31 @@ def search(nums, target):
     Returns:
         Index of target if found, -1 otherwise
     """
-    if not nums:
-        return -1
+    if len(nums) <= SMALL_ARRAY_SIZE:
+        return nums.index(target) if target in nums else -1
     
     left = 0
     right = len(nums) - 1
     
     while left <= right:
-        mid = (left + right) // 2
+        mid = (left + right) >> 1
+        mid_val = nums[mid]
         
-        if nums[mid] == target:
+        if mid_val == target:
             return mid
         
-        # Check which half is sorted
-        if nums[left] <= nums[mid]:  # Left half is sorted
-            # Check if target is in the sorted left half
-            if nums[left] <= target < nums[mid]:
-                right = mid - 1
-            else:
-                left = mid + 1
-        else:  # Right half is sorted
-            # Check if target is in the sorted right half
-            if nums[mid] < target <= nums[right]:
-                left = mid + 1
-            else:
-                right = mid - 1
+        # Read each bound once per iteration. The target lies left of mid when
+        # the left half is sorted and contains it, or when the right half is
+        # sorted and does not.
+        left_val = nums[left]
+        if left_val <= mid_val:
+            go_left = left_val <= target < mid_val
+        else:
+            go_left = not (mid_val < target <= nums[right])
+        
+        if go_left:
+            right = mid - 1
+        else:
+            left = mid + 1
     
     return -1 
\ No newline at end of file
@@ -0,0 +1,32 @@
+"""
+Optional Cython build of the LeetCode Medium reference solutions.
+
+Cython compiles the plain .py sources unchanged (no .pyx rewrite), and the
+resulting extension modules take precedence over the .py files on import:
+
+    pip install cython
+    cd benchmarks/leetcode_medium_solutions
+    python setup.py build_ext --inplace
+
+Delete the generated .c/.so files to go back to the pure-Python solutions.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+# Scalar-loop solutions that benefit most from compilation
+SOLUTIONS = [
+    'container_with_most_water.py',
+    'search_rotated_sorted_array.py',
+    'product_except_self.py',
+    'longest_substring_without_repeating.py',
+    'three_sum.py',
+    'spiral_matrix.py',
+    'rotate_image.py',
+    'group_anagrams.py',
+]
+
+setup(
+    name='leetcode_medium_solutions',
+    ext_modules=cythonize(SOLUTIONS, language_level=3),
+)
@@ -6,6 +6,7 @@ Validates that all implemented solutions work correctly.
 
 import sys
 import os
+from collections import deque
 
 # Add the current directory to Python path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -21,16 +22,17 @@ from spiral_matrix import spiralOrder
 from search_rotated_sorted_array import search
 from validate_bst import isValidBST, TreeNode
 
+# Expected results for order-insensitive problems, sorted into canonical
+# form once rather than on every run
+EXPECTED_THREE_SUM_1 = sorted([[-1, -1, 2], [-1, 0, 1]])
+EXPECTED_GROUP_ANAGRAMS_1 = sorted(sorted(group) for group in [["ate", "eat", "tea"], ["bat"], ["nat", "tan"]])
+
 def create_linked_list(values):
     """Helper function to create a linked list from a list of values."""
-    if not values:
-        return None
-    
-    head = ListNode(values[0])
-    current = head
-    for val in values[1:]:
-        current.next = ListNode(val)
-        current = current.next
+    # Build from the tail so each node is linked as it is constructed
+    head = None
+    for val in reversed(values):
+        head = ListNode(val, head)
     return head
 
 def linked_list_to_list(head):
@@ -48,11 +50,11 @@ def create_binary_tree(values):
         return None
     
     root = TreeNode(values[0])
-    queue = [root]
+    queue = deque([root])
     i = 1
     
     while queue and i < len(values):
-        node = queue.pop(0)
+        node = queue.popleft()
         
         # Left child
         if i < len(values) and values[i] is not None:
@@ -75,10 +77,9 @@ def test_three_sum():
     # Test case 1
     nums1 = [-1, 0, 1, 2, -1, -4]
     result1 = threeSum(nums1)
-    expected1 = [[-1, -1, 2], [-1, 0, 1]]
+    expected1 = EXPECTED_THREE_SUM_1
     # Sort for comparison since order doesn't matter
     result1.sort()
-    expected1.sort()
     assert result1 == expected1, f"Test 1 failed: {result1} != {expected1}"
     
     # Test case 2
@@ -123,6 +124,12 @@ def test_longest_substring():
     expected4 = 0
     assert result4 == expected4, f"Test 4 failed: {result4} != {expected4}"
     
+    # Test case 5: non-ASCII characters
+    s5 = "é😀aé😀"
+    result5 = lengthOfLongestSubstring(s5)
+    expected5 = 3  # "é😀a"
+    assert result5 == expected5, f"Test 5 failed: {result5} != {expected5}"
+    
     print("✓ Longest Substring tests passed")
 
 def test_add_two_numbers():
@@ -160,11 +167,8 @@ def test_group_anagrams():
     strs1 = ["eat", "tea", "tan", "ate", "nat", "bat"]
     result1 = groupAnagrams(strs1)
     # Sort each group and the groups themselves for comparison
-    result1 = [sorted(group) for group in result1]
-    result1.sort()
-    expected1 = [["ate", "eat", "tea"], ["bat"], ["nat", "tan"]]
-    expected1 = [sorted(group) for group in expected1]
-    expected1.sort()
+    result1 = sorted(map(sorted, result1))
+    expected1 = EXPECTED_GROUP_ANAGRAMS_1
     assert result1 == expected1, f"Test 1 failed: {result1} != {expected1}"
     
     # Test case 2
@@ -179,6 +183,12 @@ def test_group_anagrams():
     expected3 = [["a"]]
     assert result3 == expected3, f"Test 3 failed: {result3} != {expected3}"
     
+    # Test case 4: characters outside a-z keep their own groups
+    strs4 = ["[", "u", "Ab", "bA", "ab", "é"]
+    result4 = sorted(map(sorted, groupAnagrams(strs4)))
+    expected4 = [["Ab", "bA"], ["["], ["ab"], ["u"], ["é"]]
+    assert result4 == expected4, f"Test 4 failed: {result4} != {expected4}"
+    
     print("✓ Group Anagrams tests passed")
 
 def test_product_except_self():
@@ -233,6 +243,16 @@ def test_rotate_image():
     expected2 = [[15, 13, 2, 5], [14, 3, 4, 1], [12, 6, 8, 9], [16, 7, 10, 11]]
     assert matrix2 == expected2, f"Test 2 failed: {matrix2} != {expected2}"
     
+    # The ring rotation must agree with an independent transpose-and-reverse
+    # for every size, including the empty and 1x1 matrices and odd centres
+    for n in range(7):
+        matrix = [[row * n + col for col in range(n)] for row in range(n)]
+        expected = [[matrix[n - 1 - col][row] for col in range(n)] for row in range(n)]
+        rows = list(matrix)
+        rotate(matrix)
+        assert matrix == expected, f"Test n={n} failed: {matrix} != {expected}"
+        assert all(a is b for a, b in zip(matrix, rows)), f"Test n={n} failed: rows were replaced"
+    
     print("✓ Rotate Image tests passed")
 
 def test_spiral_matrix():
@@ -0,0 +1,7 @@
+# Cython declarations for three_sum.py, used only by the optional setup.py
+# build: the index arithmetic compiles to C integers while values stay
+# Python ints, so results are identical to the pure-Python module.
+import cython
+
+@cython.locals(n=Py_ssize_t, i=Py_ssize_t, left=Py_ssize_t, right=Py_ssize_t)
+cpdef list threeSum(list nums)
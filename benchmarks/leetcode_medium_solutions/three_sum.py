@@ -24,20 +24,33 @@ def threeSum(nums):
     
     nums.sort()  # Sort the array first
     result = []
+    n = len(nums)
+    largest_pair = nums[-1] + nums[-2]
     
-    for i in range(len(nums) - 2):
+    for i in range(n - 2):
+        first = nums[i]
+        
+        # Sorted: once the three smallest candidates sum above zero, no later
+        # triplet can reach zero
+        if first + nums[i + 1] + nums[i + 2] > 0:
+            break
+        
         # Skip duplicate values for the first element
-        if i > 0 and nums[i] == nums[i - 1]:
+        if i > 0 and first == nums[i - 1]:
+            continue
+        
+        # Even the two largest values cannot lift this element to zero
+        if first + largest_pair < 0:
             continue
             
         left = i + 1
-        right = len(nums) - 1
+        right = n - 1
         
         while left < right:
-            current_sum = nums[i] + nums[left] + nums[right]
+            current_sum = first + nums[left] + nums[right]
             
             if current_sum == 0:
-                result.append([nums[i], nums[left], nums[right]])
+                result.append([first, nums[left], nums[right]])
                 
                 # Skip duplicates for left pointer
                 while left < right and nums[left] == nums[left + 1]:
@@ -53,4 +66,4 @@ def threeSum(nums):
             else:
                 right -= 1
                 
-    return result 
\ No newline at end of file
+    return result
@@ -11,8 +11,15 @@ Time Complexity: O(n)
 Space Complexity: O(h) where h is the height of the tree
 """
 
+import math
+
+# Sentinel below every key, created once instead of on each call
+NEG_INF = -math.inf
+
 class TreeNode:
     """Definition for a binary tree node."""
+    __slots__ = ('val', 'left', 'right')
+    
     def __init__(self, val=0, left=None, right=None):
         self.val = val
         self.left = left
@@ -28,28 +35,25 @@ def isValidBST(root):
     Returns:
         Boolean indicating if the tree is a valid BST
     """
-    def validate(node, min_val, max_val):
-        """
-        Helper function to validate BST with bounds.
-        
-        Args:
-            node: Current node being validated
-            min_val: Minimum allowed value for this node
-            max_val: Maximum allowed value for this node
-            
-        Returns:
-            Boolean indicating if subtree rooted at node is valid BST
-        """
-        if not node:
-            return True
+    # In-order traversal of a BST visits keys in strictly increasing order.
+    # An explicit stack avoids a Python frame per node and RecursionError on
+    # deep (skewed) trees.
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    node = root
+    prev = NEG_INF
+    
+    while node or stack:
+        # Walk down to the leftmost unvisited node
+        while node:
+            push(node)
+            node = node.left
         
-        # Check if current node violates BST property
-        if node.val <= min_val or node.val >= max_val:
+        node = pop()
+        if node.val <= prev:
             return False
-        
-        # Recursively validate left and right subtrees with updated bounds
-        return (validate(node.left, min_val, node.val) and 
-                validate(node.right, node.val, max_val))
+        prev = node.val
+        node = node.right
     
-    # Start validation with infinite bounds
-    return validate(root, float('-inf'), float('inf')) 
\ No newline at end of file
+    return True
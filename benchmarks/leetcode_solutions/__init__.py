@@ -0,0 +1,6 @@
+"""
+LeetCode Easy reference solutions.
+
+Each solution also runs as a standalone module from this directory, which is
+how test_solutions.py imports them.
+"""
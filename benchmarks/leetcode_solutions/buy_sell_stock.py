@@ -13,15 +13,17 @@ def max_profit(prices):
     if not prices or len(prices) < 2:
         return 0
     
-    min_price = prices[0]
+    # Take the first price off a shared iterator rather than slicing a copy
+    remaining = iter(prices)
+    min_price = next(remaining)
     max_profit = 0
     
-    for price in prices[1:]:
-        # Update minimum price seen so far
-        min_price = min(min_price, price)
-        # Calculate profit if we sell at current price
-        profit = price - min_price
-        # Update maximum profit
-        max_profit = max(max_profit, profit)
+    for price in remaining:
+        # Update minimum price seen so far; selling on a new low can't profit
+        if price < min_price:
+            min_price = price
+        # Otherwise update maximum profit if we sell at current price
+        elif price - min_price > max_profit:
+            max_profit = price - min_price
     
     return max_profit 
\ No newline at end of file
@@ -4,6 +4,7 @@ def climb_stairs(n):
     Each time you can either climb 1 or 2 steps. In how many distinct ways can you climb to the top?
     
     This is essentially the Fibonacci sequence: f(n) = f(n-1) + f(n-2)
+    Computed by fast doubling in O(log n) steps.
     
     Args:
         n: Integer representing the number of steps
@@ -14,13 +15,19 @@ def climb_stairs(n):
     if n <= 2:
         return n
     
-    # Dynamic programming approach - only need to track last two values
-    prev2 = 1  # f(1)
-    prev1 = 2  # f(2)
+    # Fast doubling: climb_stairs(n) is Fibonacci F(n + 1). Walking the bits
+    # of n + 1 from the top, each step maps (F(k), F(k+1)) to
+    # (F(2k), F(2k+1)) and optionally advances by one, so O(log n) bignum
+    # multiplications replace O(n) additions
+    #   F(2k)   = F(k) * (2*F(k+1) - F(k))
+    #   F(2k+1) = F(k)^2 + F(k+1)^2
+    a, b = 0, 1  # F(0), F(1)
+    for bit in bin(n + 1)[2:]:
+        c = a * ((b << 1) - a)
+        d = a * a + b * b
+        if bit == '1':
+            a, b = d, c + d
+        else:
+            a, b = c, d
     
-    for i in range(3, n + 1):
-        current = prev1 + prev2
-        prev2 = prev1
-        prev1 = current
-    
-    return prev1 
\ No newline at end of file
+    return a
@@ -0,0 +1,7 @@
+class ListNode:
+    """Definition for singly-linked list, shared by the linked-list solutions."""
+    __slots__ = ('val', 'next')
+    
+    def __init__(self, val=0, next=None):
+        self.val = val
+        self.next = next
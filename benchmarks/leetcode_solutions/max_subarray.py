@@ -16,10 +16,15 @@ def max_sub_array(nums):
     max_sum = nums[0]
     current_sum = nums[0]
     
-    for i in range(1, len(nums)):
+    for num in nums[1:]:
         # Either extend the existing subarray or start a new one
-        current_sum = max(nums[i], current_sum + nums[i])
+        # (inline comparisons instead of two max() calls per element)
+        if current_sum > 0:
+            current_sum += num
+        else:
+            current_sum = num
         # Update the maximum sum seen so far
-        max_sum = max(max_sum, current_sum)
+        if current_sum > max_sum:
+            max_sum = current_sum
     
     return max_sum 
\ No newline at end of file
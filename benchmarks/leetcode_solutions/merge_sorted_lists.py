@@ -1,7 +1,7 @@
-class ListNode:
-    def __init__(self, val=0, next=None):
-        self.val = val
-        self.next = next
+try:
+    from .list_node import ListNode
+except ImportError:  # Run from this directory rather than as a package
+    from list_node import ListNode
 
 def merge_two_lists(list1, list2):
     """
@@ -16,25 +16,28 @@ def merge_two_lists(list1, list2):
     Returns:
         ListNode representing the head of the merged sorted linked list
     """
-    # Create a dummy node to simplify the logic
-    dummy = ListNode(0)
-    current = dummy
+    # An empty side leaves nothing to merge
+    if not list1:
+        return list2
+    if not list2:
+        return list1
     
-    # Merge the two lists
-    while list1 and list2:
-        if list1.val <= list2.val:
-            current.next = list1
-            list1 = list1.next
-        else:
-            current.next = list2
-            list2 = list2.next
-        current = current.next
+    # Start from the smaller head so no dummy node is needed; list1 is always
+    # the list currently being walked
+    if list2.val < list1.val:
+        list1, list2 = list2, list1
+    head = list1
     
-    # Append the remaining nodes
-    if list1:
-        current.next = list1
-    elif list2:
-        current.next = list2
+    while list2:
+        # Nodes of list1 that stay <= list2's head are already linked in
+        # order, so walk the whole run without rewriting any pointers
+        while list1.next and list1.next.val <= list2.val:
+            list1 = list1.next
+        
+        # Splice list2 in after the run and continue from there; the rest of
+        # list1 becomes the other side
+        rest = list1.next
+        list1.next = list2
+        list1, list2 = list2, rest
     
-    # Return the head of the merged list (skip dummy node)
-    return dummy.next 
\ No newline at end of file
+    return head
@@ -17,6 +17,10 @@ def is_palindrome(x):
     if x < 10:
         return True
     
+    # A trailing zero would need a leading zero: reject without building strings
+    if x % 10 == 0:
+        return False
+    
     # Convert to string and check if it reads the same forwards and backwards
     s = str(x)
     return s == s[::-1] 
\ No newline at end of file
@@ -11,6 +11,15 @@ def plus_one(digits):
     Returns:
         List of integers representing the incremented number
     """
+    # Common case: the last digit absorbs the increment
+    if digits and digits[-1] < 9:
+        digits[-1] += 1
+        return digits
+    
+    # All nines (e.g., 999 -> 1000): list.count scans in C
+    if digits.count(9) == len(digits):
+        return [1] + [0] * len(digits)
+    
     # Start from the rightmost digit
     for i in range(len(digits) - 1, -1, -1):
         if digits[i] < 9:
@@ -1,7 +1,7 @@
-class ListNode:
-    def __init__(self, val=0, next=None):
-        self.val = val
-        self.next = next
+try:
+    from .list_node import ListNode
+except ImportError:  # Run from this directory rather than as a package
+    from list_node import ListNode
 
 def reverse_list(head):
     """
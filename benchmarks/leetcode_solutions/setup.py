@@ -0,0 +1,35 @@
+"""
+Optional Cython build of the LeetCode Easy reference solutions.
+
+Cython compiles the plain .py sources unchanged (no .pyx rewrite), and the
+resulting extension modules take precedence over the .py files on import:
+
+    pip install cython
+    cd benchmarks/leetcode_solutions
+    python setup.py build_ext --inplace
+
+Delete the generated .c/.so files to go back to the pure-Python solutions.
+"""
+
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+# Scalar-loop solutions that benefit most from compilation
+SOLUTIONS = [
+    'max_subarray.py',
+    'buy_sell_stock.py',
+    'climbing_stairs.py',
+    'two_sum.py',
+    'valid_parentheses.py',
+    'remove_duplicates.py',
+    'plus_one.py',
+    'palindrome_number.py',
+]
+
+setup(
+    name='leetcode_solutions',
+    # Name each module explicitly: this directory is also a package, and
+    # Cython would otherwise build benchmarks.leetcode_solutions.* modules
+    ext_modules=cythonize([Extension(source[:-3], [source]) for source in SOLUTIONS],
+                          language_level=3),
+)
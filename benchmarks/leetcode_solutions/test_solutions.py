@@ -9,7 +9,7 @@ import os
 # Add the current directory to the path so we can import the solutions
 sys.path.append(os.path.dirname(__file__))
 
-from two_sum import two_sum
+from two_sum import two_sum, two_sum_batch
 from valid_parentheses import is_valid
 from max_subarray import max_sub_array
 from buy_sell_stock import max_profit
@@ -17,8 +17,9 @@ from remove_duplicates import remove_duplicates
 from climbing_stairs import climb_stairs
 from plus_one import plus_one
 from palindrome_number import is_palindrome
-from reverse_linked_list import ListNode as ReverseListNode, reverse_list
-from merge_sorted_lists import ListNode as MergeListNode, merge_two_lists
+from list_node import ListNode
+from reverse_linked_list import reverse_list
+from merge_sorted_lists import merge_two_lists
 
 def test_two_sum():
     print("Testing Two Sum...")
@@ -37,6 +38,20 @@ def test_two_sum():
             print(f"  Test {i}: PASS - {result}")
         else:
             print(f"  Test {i}: FAIL - Expected {expected}, got {result}")
+    
+    # Batched queries share one index over nums and return two_sum's pairs,
+    # including where several pairs sum to the target
+    batch_cases = [
+        (([3, 3, 1, 2, 4], [6, 3, 7, 100]), [[0, 1], [2, 3], [1, 4], []]),
+        (([1, 2, 3, 4], [5, 7]), [[1, 2], [2, 3]])
+    ]
+    
+    for i, ((nums, targets), expected) in enumerate(batch_cases, len(test_cases) + 1):
+        result = two_sum_batch(nums, targets)
+        if result == expected and result == [two_sum(nums, target) for target in targets]:
+            print(f"  Test {i}: PASS - batch {targets} -> {result}")
+        else:
+            print(f"  Test {i}: FAIL - batch {targets} -> Expected {expected}, got {result}")
 
 def test_valid_parentheses():
     print("Testing Valid Parentheses...")
@@ -163,13 +178,10 @@ def test_palindrome_number():
 
 def create_linked_list(arr):
     """Helper function to create linked list from array"""
-    if not arr:
-        return None
-    head = ReverseListNode(arr[0])
-    current = head
-    for val in arr[1:]:
-        current.next = ReverseListNode(val)
-        current = current.next
+    # Build from the tail so each node is linked as it is constructed
+    head = None
+    for val in reversed(arr):
+        head = ListNode(val, head)
     return head
 
 def linked_list_to_array(head):
@@ -199,26 +211,6 @@ def test_reverse_linked_list():
         else:
             print(f"  Test {i}: FAIL - {input_arr} -> Expected {expected}, got {result}")
 
-def create_merge_linked_list(arr):
-    """Helper function to create linked list from array for merge function"""
-    if not arr:
-        return None
-    head = MergeListNode(arr[0])
-    current = head
-    for val in arr[1:]:
-        current.next = MergeListNode(val)
-        current = current.next
-    return head
-
-def merge_linked_list_to_array(head):
-    """Helper function to convert linked list to array for merge function"""
-    result = []
-    current = head
-    while current:
-        result.append(current.val)
-        current = current.next
-    return result
-
 def test_merge_sorted_lists():
     print("Testing Merge Two Sorted Lists...")
     test_cases = [
@@ -229,10 +221,10 @@ def test_merge_sorted_lists():
     ]
     
     for i, ((list1_arr, list2_arr), expected) in enumerate(test_cases, 1):
-        list1 = create_merge_linked_list(list1_arr)
-        list2 = create_merge_linked_list(list2_arr)
+        list1 = create_linked_list(list1_arr)
+        list2 = create_linked_list(list2_arr)
         result_head = merge_two_lists(list1, list2)
-        result = merge_linked_list_to_array(result_head)
+        result = linked_list_to_array(result_head)
         if result == expected:
             print(f"  Test {i}: PASS - {list1_arr} + {list2_arr} -> {result}")
         else:
@@ -0,0 +1,7 @@
+# Cython declarations for two_sum.py, used only by the optional setup.py
+# build: the dict and index are typed so lookups and the loop counter skip
+# generic dispatch, while two_sum.py itself stays plain Python.
+import cython
+
+@cython.locals(num_map=dict, i=Py_ssize_t)
+cpdef list two_sum(list nums, target)
@@ -1,3 +1,7 @@
+from bisect import bisect_left
+from collections import defaultdict
+
+
 def two_sum(nums, target):
     """
     Given an array of integers nums and an integer target, return indices of the two numbers such that they add up to target.
@@ -18,4 +22,38 @@ def two_sum(nums, target):
             return [num_map[complement], i]
         num_map[num] = i
     
-    return []  # Should not reach here given problem constraints 
\ No newline at end of file
+    return []  # Should not reach here given problem constraints 
+
+def two_sum_batch(nums, targets):
+    """
+    Answer two_sum for several targets over the same array of integers.
+    
+    The value -> indices map is built once and shared by every query, so each
+    target only pays for a scan with lookups, never for rebuilding the map.
+    Each answer is the same pair two_sum would return for that target.
+    
+    Args:
+        nums: List of integers
+        targets: Iterable of integer target sums
+        
+    Returns:
+        List with the two indices for each target, in order, or [] where no
+        pair sums to that target
+    """
+    # Ascending indices of each value, so a query can find the complement's
+    # latest index before j, which is the one two_sum's map holds at j
+    positions = defaultdict(list)
+    for i, num in enumerate(nums):
+        positions[num].append(i)
+    
+    answers = []
+    for target in targets:
+        for j, num in enumerate(nums):
+            indices = positions.get(target - num)
+            if indices and indices[0] < j:
+                answers.append([indices[bisect_left(indices, j) - 1], j])
+                break
+        else:
+            answers.append([])
+    
+    return answers
\ No newline at end of file
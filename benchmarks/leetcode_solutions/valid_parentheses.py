@@ -1,3 +1,6 @@
+# Mapping of closing to opening brackets, built once at import
+MATCHING_OPENER = {')': '(', '}': '{', ']': '['}
+
 def is_valid(s):
     """
     Given a string s containing just the characters '(', ')', '{', '}', '[' and ']', 
@@ -9,11 +12,13 @@ def is_valid(s):
     Returns:
         Boolean indicating if the string is valid
     """
+    # Every bracket needs a partner, so odd lengths can never balance
+    if len(s) % 2:
+        return False
+    
     # Stack to keep track of opening brackets
     stack = []
-    
-    # Mapping of closing to opening brackets
-    mapping = {')': '(', '}': '{', ']': '['}
+    mapping = MATCHING_OPENER
     
     for char in s:
         if char in mapping:
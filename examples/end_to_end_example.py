@@ -7,54 +7,19 @@ Demonstrates a complete, end-to-end run where an agent solves a coding problem.
 
 import sys
 import os
+import argparse
 import tempfile
-import shutil
-import time
-import threading
 import importlib.util
-from datetime import datetime
+import pprint
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from dotenv import load_dotenv
 from auto_codex.core import CodexRun
-from auto_codex.health import get_health_monitor
-import pprint
-
-# Add auto_codex to path for examples
-sys.path.insert(0, '.')
-
-from auto_codex import CodexRun
-from examples.real_time_inspector_example import SimpleAgentInspector
-
-# Load environment variables from .env file
-load_dotenv()
-
-def create_two_sum_prompt():
-    """Creates a prompt to solve the Two Sum LeetCode problem."""
-    return """
-You are being tested on your ability to solve beginner-level LeetCode problems.
-You will be given a series of coding challenges that test fundamental programming concepts.
-
-Your task is to:
-1. Create a Python file with the specified filename.
-2. Implement the required function with the exact name specified.
-3. Ensure your solution handles all the given test cases correctly.
-4. Write clean, efficient code that solves the problem.
-
-Each problem will specify the expected filename and function name. Make sure to follow these exactly.
 
-Hint: To write the python code to a file, you can use `echo -e "your code here" >> your_file.py`.
-
-Create a Python file called 'two_sum.py' with a function named 'two_sum' that solves LeetCode Problem #1.
-
-Problem: Given an array of integers nums and an integer target, return indices of the two numbers such that they add up to target. You may assume that each input would have exactly one solution, and you may not use the same element twice. You can return the answer in any order.
-
-Example:
-- Input: nums = [2,7,11,15], target = 9
-- Output: [0,1] (because nums[0] + nums[1] == 9)
-"""
+# Indices two_sum must return for the verification case, in either order
+EXPECTED_INDICES = frozenset({0, 1})
 
 def verify_solution(directory: str) -> bool:
     """Verify that the agent correctly solved the Two Sum problem."""
@@ -78,18 +43,16 @@ def verify_solution(directory: str) -> bool:
         # Run test case
         nums = [2, 7, 11, 15]
         target = 9
-        expected = [0, 1]
         
         result = two_sum_func(nums, target)
-        # Sort to handle any order
-        if isinstance(result, list):
-            result.sort()
-        
-        if result == expected:
+        # Compare as a set to accept any order without mutating the result;
+        # the length check still rejects answers like [0, 0, 1]
+        if (isinstance(result, (list, tuple)) and len(result) == len(EXPECTED_INDICES)
+                and set(result) == EXPECTED_INDICES):
             print(f"✅ Verification successful! `two_sum({nums}, {target})` returned `{result}`.")
             return True
         else:
-            print(f"❌ Verification failed: `two_sum({nums}, {target})` returned `{result}`, expected `{expected}`.")
+            print(f"❌ Verification failed: `two_sum({nums}, {target})` returned `{result}`, expected `{sorted(EXPECTED_INDICES)}` in any order.")
             return False
             
     except Exception as e:
@@ -104,9 +67,15 @@ def print_json_line(line: dict):
 
 def main():
     """Run the end-to-end example."""
-    # Load .env file for API keys
-    if not load_dotenv():
-        print("⚠️  Warning: .env file not found. Please create one with your OPENAI_API_KEY.")
+    parser = argparse.ArgumentParser(description='Auto-Codex end-to-end example')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Print every JSON line the agent emits')
+    args = parser.parse_args()
+
+    # Load .env file for API keys; a key already exported in the shell works too
+    load_dotenv(override=False)
+    if not os.environ.get("OPENAI_API_KEY"):
+        print("⚠️  Warning: OPENAI_API_KEY is not set. Export it or add it to a .env file.")
         sys.exit(1)
 
     print("Auto-Codex End-to-End Example")
@@ -153,7 +122,7 @@ Example:
             writable_root=temp_dir,
             timeout=180,
             dangerously_auto_approve_everything=True,
-            on_json_line=print_json_line
+            on_json_line=print_json_line if args.verbose else None
         )
         
         print(f"🚀 Starting agent run: {run.run_id}")
@@ -11,6 +11,7 @@ Demonstrates health monitoring capabilities:
 import sys
 import os
 import time
+import threading
 from datetime import datetime
 
 # Add auto_codex to path for examples
@@ -55,22 +56,49 @@ def real_time_monitoring():
     
     print(f"Monitoring: {run.run_id[:8]}...")
     
-    # Monitor for 10 seconds
-    for i in range(5):
-        time.sleep(2)
-        health = run.get_health_status()
-        
-        if health:
-            status_icon = "✅" if health.status.value == "completed" else "❌" if health.status.value == "failed" else " "
-            health_icon = "✅" if health.health.value == "healthy" else "❌" if health.health.value == "unhealthy" else "✅"
+    # Wake up only when the monitor reports a change for this run instead of
+    # polling on a fixed interval
+    changed = threading.Event()
+    
+    def on_change(agent_id, _):
+        if agent_id == run.run_id:
+            changed.set()
+    
+    monitor = get_health_monitor()
+    monitor.add_status_callback(on_change)
+    monitor.add_health_callback(on_change)
+    
+    try:
+        # Monitor for up to 10 seconds
+        deadline = time.monotonic() + 10
+        check = 0
+        while True:
+            health = run.get_health_status()
+            check += 1
             
-            print(f"  Check {i+1}: {status_icon} {health.status.value} | {health_icon} {health.health.value} | {health.runtime_seconds:.1f}s")
+            if health:
+                status_icon = "✅" if health.status.value == "completed" else "❌" if health.status.value == "failed" else " "
+                health_icon = "✅" if health.health.value == "healthy" else "❌" if health.health.value == "unhealthy" else "✅"
+                
+                print(f"  Check {check}: {status_icon} {health.status.value} | {health_icon} {health.health.value} | {health.runtime_seconds:.1f}s")
+                
+                # Alert on issues
+                if health.health.value == "unhealthy":
+                    print(f"    ALERT: Agent unhealthy!")
+                elif health.runtime_seconds > 8:
+                    print(f"    WARNING: Long runtime ({health.runtime_seconds:.1f}s)")
+                
+                if health.status.value in ("completed", "failed"):
+                    break
             
-            # Alert on issues
-            if health.health.value == "unhealthy":
-                print(f"    ALERT: Agent unhealthy!")
-            elif health.runtime_seconds > 8:
-                print(f"    WARNING: Long runtime ({health.runtime_seconds:.1f}s)")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not changed.wait(remaining):
+                break
+            changed.clear()
+    finally:
+        # The monitor is shared, so drop the closures once this run is done
+        monitor.remove_status_callback(on_change)
+        monitor.remove_health_callback(on_change)
     
     return run
 
@@ -105,13 +133,13 @@ def session_health_monitoring():
     healthy_count = 0
     running_count = 0
     
-    for run in runs:
-        health = run.get_health_status()
-        if health:
-            if health.health.value == "healthy":
-                healthy_count += 1
-            if health.is_running:
-                running_count += 1
+    # One locked lookup for every run rather than one per run
+    statuses = get_health_monitor().get_agents_health(run.run_id for run in runs)
+    for health in statuses.values():
+        if health.health.value == "healthy":
+            healthy_count += 1
+        if health.is_running:
+            running_count += 1
     
     print(f"Session: {session.session_id}")
     print(f"Total runs: {len(runs)}")
@@ -153,9 +181,13 @@ def health_analytics():
     healthy_count = 0
     total_runtime = 0
     
+    statuses = get_health_monitor().get_agents_health(run.run_id for _, run in runs)
+    
     print("\nAnalytics Report:")
     for run_type, run in runs:
-        health = run.get_health_status()
+        health = statuses.get(run.run_id)
+        if not health:
+            continue
         
         if health.health.value == "healthy":
             healthy_count += 1
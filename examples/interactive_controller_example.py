@@ -8,12 +8,13 @@ Demonstrates interactive agent control:
 - Dynamic agent management
 """
 
+import os
 import sys
 import time
 from typing import Dict, Any
 
-# Add auto_codex to path for examples
-sys.path.insert(0, 'auto_codex')
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from auto_codex import CodexRun, CodexSession
 
@@ -21,6 +22,8 @@ from auto_codex import CodexRun, CodexSession
 class SimpleAgentController:
     """Simple agent controller for demonstrations"""
     
+    __slots__ = ('session', 'active_runs', 'callbacks')
+    
     def __init__(self):
         self.session = CodexSession(session_id="controller-demo")
         self.active_runs: Dict[str, CodexRun] = {}
@@ -42,20 +45,30 @@ class SimpleAgentController:
     
     def stop_agent(self, agent_id: str) -> bool:
         """Stop an active agent"""
-        if agent_id in self.active_runs:
-            run = self.active_runs[agent_id]
+        run = self.active_runs.pop(agent_id, None)
+        if run is not None:
             # In real implementation, would call run.stop()
-            del self.active_runs[agent_id]
             print(f"Stopped agent {agent_id}")
             return True
         return False
     
     def get_agent_status(self, agent_id: str) -> Dict[str, Any]:
         """Get status of specific agent"""
-        if agent_id not in self.active_runs:
+        run = self.active_runs.get(agent_id)
+        if run is None:
             return {"error": "Agent not found"}
         
-        run = self.active_runs[agent_id]
+        return self._run_status(agent_id, run)
+    
+    def list_agents(self) -> Dict[str, Dict]:
+        """List all active agents"""
+        # Walk the runs directly rather than re-checking and re-fetching
+        # each id through get_agent_status
+        return {aid: self._run_status(aid, run) for aid, run in self.active_runs.items()}
+    
+    @staticmethod
+    def _run_status(agent_id: str, run: CodexRun) -> Dict[str, Any]:
+        """Build the status summary for one run"""
         return {
             "id": agent_id,
             "status": run.status,
@@ -64,10 +77,6 @@ class SimpleAgentController:
             "results_count": len(run.results) if run.results else 0
         }
     
-    def list_agents(self) -> Dict[str, Dict]:
-        """List all active agents"""
-        return {aid: self.get_agent_status(aid) for aid in self.active_runs}
-    
     def add_callback(self, callback_func):
         """Add callback for agent events"""
         self.callbacks.append(callback_func)
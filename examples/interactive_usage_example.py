@@ -8,15 +8,21 @@ Demonstrates interactive auto_codex usage:
 - Real-time result processing
 """
 
+import os
 import sys
 import time
-from typing import List, Dict
+import threading
+from collections import defaultdict
+from typing import List, Dict, Set
 
-# Add auto_codex to path for examples
-sys.path.insert(0, 'auto_codex')
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from auto_codex import CodexRun, CodexSession, get_health_monitor
 
+# Longest wait between refreshes when no status or health change arrives
+WATCHDOG_INTERVAL = 5
+
 
 class InteractiveCodexDemo:
     """Interactive auto_codex demonstration"""
@@ -27,6 +33,17 @@ class InteractiveCodexDemo:
             enable_health_monitoring=True
         )
         self.runs: List[CodexRun] = []
+        # Runs keyed by the 8-character short ID that add_task prints
+        self._by_prefix: Dict[str, List[CodexRun]] = defaultdict(list)
+        
+        # Status and health transitions wake monitor_progress rather than a
+        # fixed polling interval
+        self._run_ids: Set[str] = set()
+        self._changed = threading.Event()
+    
+    def _on_change(self, agent_id: str, _):
+        if agent_id in self._run_ids:
+            self._changed.set()
     
     def add_task(self, prompt: str, model: str = "gpt-4") -> CodexRun:
         """Add a new task to the session"""
@@ -36,11 +53,17 @@ class InteractiveCodexDemo:
             provider="openai"
         )
         self.runs.append(run)
+        self._run_ids.add(run.run_id)
+        self._by_prefix[run.run_id[:8]].append(run)
         print(f"Added task: {prompt[:40]}... (ID: {run.run_id[:8]})")
         return run
     
     def check_status(self) -> Dict:
         """Check status of all runs"""
+        return self._summarize(get_health_monitor().get_agents_health(self._run_ids))
+    
+    def _summarize(self, statuses: Dict) -> Dict:
+        """Count runs by status from an already-fetched health mapping"""
         status_summary = {
             "total": len(self.runs),
             "completed": 0,
@@ -48,15 +71,13 @@ class InteractiveCodexDemo:
             "failed": 0
         }
         
-        for run in self.runs:
-            health = run.get_health_status()
-            if health:
-                if health.status.value == "completed":
-                    status_summary["completed"] += 1
-                elif health.status.value == "running":
-                    status_summary["running"] += 1
-                elif health.status.value == "failed":
-                    status_summary["failed"] += 1
+        for health in statuses.values():
+            if health.status.value == "completed":
+                status_summary["completed"] += 1
+            elif health.status.value == "running":
+                status_summary["running"] += 1
+            elif health.status.value == "failed":
+                status_summary["failed"] += 1
         
         return status_summary
     
@@ -64,7 +85,13 @@ class InteractiveCodexDemo:
         """Get results from specific run or all runs"""
         results = []
         
-        target_runs = [r for r in self.runs if r.run_id.startswith(run_id)] if run_id else self.runs
+        if not run_id:
+            target_runs = self.runs
+        else:
+            # IDs of at least the short length narrow to one bucket before the
+            # prefix check; shorter prefixes still scan every run
+            candidates = self._by_prefix.get(run_id[:8], []) if len(run_id) >= 8 else self.runs
+            target_runs = [r for r in candidates if r.run_id.startswith(run_id)]
         
         for run in target_runs:
             if run.results:
@@ -82,20 +109,47 @@ class InteractiveCodexDemo:
         """Monitor progress of all runs"""
         print(f"Monitoring progress for {duration} seconds...")
         
-        start_time = time.time()
-        while time.time() - start_time < duration:
-            status = self.check_status()
+        monitor = get_health_monitor()
+        # Only listen while monitoring, so the shared monitor doesn't keep
+        # calling back into this demo afterwards
+        monitor.add_status_callback(self._on_change)
+        monitor.add_health_callback(self._on_change)
+        try:
+            self._watch(duration)
+        finally:
+            monitor.remove_status_callback(self._on_change)
+            monitor.remove_health_callback(self._on_change)
+    
+    def _watch(self, duration: int):
+        """Print progress on every change until all runs finish or duration passes"""
+        self._changed.clear()
+        deadline = time.monotonic() + duration
+        monitor = get_health_monitor()
+        while True:
+            # One lookup per refresh feeds both the summary and the per-run lines
+            statuses = monitor.get_agents_health(self._run_ids)
+            status = self._summarize(statuses)
             print(f"Status: {status['completed']} completed, {status['running']} running, {status['failed']} failed")
             
             # Show individual run status
             for run in self.runs[-3:]:  # Show last 3 runs
-                health = run.get_health_status()
+                health = statuses.get(run.run_id)
                 if health:
                     status_icon = "✅" if health.status.value == "completed" else "❌" if health.status.value == "failed" else "✅"
                     print(f"  {run.run_id[:8]}: {status_icon} {health.status.value} ({health.runtime_seconds:.1f}s)")
             
-            time.sleep(2)
             print()
+            finished = sum(1 for health in statuses.values() if health.is_finished)
+            if self.runs and finished == len(self.runs):
+                break
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            
+            # Refresh on the next change, or after the watchdog interval
+            self._changed.wait(min(remaining, WATCHDOG_INTERVAL))
+            self._changed.clear()
 
 
 def basic_interactive_example():
@@ -174,7 +174,7 @@ def provider_comparison_example():
             print(f"Failed to create {provider} run: {e}")
     
     print(f"\nComparison setup complete: {len(runs)} providers")
-    print("Execute session to compare results across providers")
+    print("Execute with session.execute_all(max_workers=3) to compare providers side by side")
     
     return session
 
@@ -9,43 +9,103 @@ Demonstrates real-time agent inspection:
 """
 
 import time
+import os
 import sys
 import threading
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Set, NamedTuple
 
-# Add auto_codex to path for examples
-sys.path.insert(0, '.')
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from auto_codex import CodexRun, CodexSession, get_health_monitor
 
+# Longest wait between refreshes when no status or health change arrives
+WATCHDOG_INTERVAL = 5
+
+STATUS_ICONS = {
+    "running": "🏃", "completed": "✅", "failed": "❌",
+    "initializing": "⏳", "cancelled": "🛑", "timeout": "⏰",
+    "waiting_approval": "🤔"
+}
+HEALTH_ICONS = {
+    "healthy": "💚", "degraded": "💛",
+    "unhealthy": "💔", "unknown": "❓"
+}
+
+
+class MonitorEvent(NamedTuple):
+    """One status/health observation logged by the inspector"""
+    timestamp: datetime
+    agent_id: str
+    status: str
+    health: str
+
 
 class SimpleAgentInspector:
     """Simple real-time agent inspector"""
     
     def __init__(self):
         self.health_monitor = get_health_monitor()
-        self.event_history: List[Dict] = []
+        self.event_history: List[MonitorEvent] = []
         self.session = CodexSession(
             session_id="inspector-demo",
             enable_health_monitoring=True
         )
+        
+        # Status and health transitions wake start_monitoring rather than a
+        # fixed polling interval
+        self._watched_ids: Set[str] = set()
+        self._changed = threading.Event()
+    
+    def _on_change(self, agent_id: str, _):
+        if agent_id in self._watched_ids:
+            self._changed.set()
     
     def start_monitoring(self, runs: List[CodexRun], duration: int = 15):
         """Start monitoring a list of runs"""
         print(f"Monitoring {len(runs)} agents for {duration}s...")
         
-        start_time = time.time()
+        self._watched_ids = {run.run_id for run in runs}
+        self._changed.clear()
+        # Only listen while monitoring, so the shared monitor doesn't keep
+        # calling back into this inspector afterwards
+        self.health_monitor.add_status_callback(self._on_change)
+        self.health_monitor.add_health_callback(self._on_change)
+        try:
+            self._watch(runs, duration)
+        finally:
+            self.health_monitor.remove_status_callback(self._on_change)
+            self.health_monitor.remove_health_callback(self._on_change)
+            self._watched_ids = set()
+        print(f"\nMonitoring complete! Logged {len(self.event_history)} events")
+    
+    def _watch(self, runs: List[CodexRun], duration: int):
+        """Print a check on every change until all runs finish or duration passes"""
+        deadline = time.monotonic() + duration
         check_count = 0
         
-        while time.time() - start_time < duration:
-            time.sleep(2)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            
+            # Refresh on the next change, or after the watchdog interval so
+            # runtimes and output previews still advance
+            self._changed.wait(min(remaining, WATCHDOG_INTERVAL))
+            self._changed.clear()
             check_count += 1
             
             print(f"\nCheck {check_count} [{self._format_time()}]:")
             
+            finished = 0
+            statuses = self.health_monitor.get_agents_health(self._watched_ids)
             for i, run in enumerate(runs, 1):
-                health = run.get_health_status()
+                health = statuses.get(run.run_id)
+                if not health:
+                    continue
+                if health.is_finished:
+                    finished += 1
                 
                 status_icon = self._get_status_icon(health.status.value)
                 health_icon = self._get_health_icon(health.health.value)
@@ -69,8 +129,9 @@ class SimpleAgentInspector:
                 print(f"  {i}. {run.run_id[:8]}: {status_icon} {health.status.value} | {health_icon} {health.health.value} | {health.runtime_seconds:.1f}s{output_preview}")
                 
                 self._log_event(run.run_id, health.status.value, health.health.value)
-        
-        print(f"\nMonitoring complete! Logged {len(self.event_history)} events")
+            
+            if finished == len(runs):
+                break
     
     def inspect_agent(self, run: CodexRun) -> Dict:
         """Detailed inspection of a specific agent"""
@@ -98,8 +159,8 @@ class SimpleAgentInspector:
         running_count = 0
         total_runtime = 0
         
-        for run in runs:
-            health = run.get_health_status()
+        statuses = self.health_monitor.get_agents_health(run.run_id for run in runs)
+        for health in statuses.values():
             if health.health.value == "healthy":
                 healthy_count += 1
             if health.is_running:
@@ -113,29 +174,16 @@ class SimpleAgentInspector:
         print(f"Total Events: {len(self.event_history)}")
     
     def _get_status_icon(self, status: str) -> str:
-        return {
-            "running": "🏃", "completed": "✅", "failed": "❌",
-            "initializing": "⏳", "cancelled": "🛑", "timeout": "⏰",
-            "waiting_approval": "🤔"
-        }.get(status, "❓")
+        return STATUS_ICONS.get(status, "❓")
     
     def _get_health_icon(self, health: str) -> str:
-        return {
-            "healthy": "💚", "degraded": "💛",
-            "unhealthy": "💔", "unknown": "❓"
-        }.get(health, "❓")
+        return HEALTH_ICONS.get(health, "❓")
     
     def _format_time(self) -> str:
         return datetime.now().strftime("%H:%M:%S")
     
     def _log_event(self, agent_id: str, status: str, health: str):
-        event = {
-            'timestamp': datetime.now(),
-            'agent_id': agent_id,
-            'status': status,
-            'health': health
-        }
-        self.event_history.append(event)
+        self.event_history.append(MonitorEvent(datetime.now(), agent_id, status, health))
 
 
 def basic_monitoring_example():
@@ -2,6 +2,7 @@ import unittest
 import tempfile
 import os
 import shutil
+import json
 from unittest.mock import patch, Mock, MagicMock, call
 from datetime import datetime
 from auto_codex.core import CodexRun, CodexSession
@@ -351,6 +352,113 @@ class TestCodexSession(unittest.TestCase):
             call(self.temp_dir)
         ])
 
+    @patch.object(CodexRun, 'execute', autospec=True)
+    def test_execute_all_concurrent(self, mock_execute):
+        """Test executing runs on a thread pool keeps results in run order."""
+        session = CodexSession(session_id=self.session_id, log_dir=self.temp_dir, validate_env=False)
+        
+        runs = [session.add_run(f"Prompt {i}") for i in range(4)]
+        
+        mock_execute.side_effect = lambda run, log_dir: CodexRunResult(
+            run_id=run.run_id,
+            start_time=datetime.now(),
+            success=True,
+            changes=[],
+            patches=[],
+            tool_usage=[]
+        )
+        
+        result = session.execute_all(max_workers=3)
+        
+        self.assertEqual([r.run_id for r in result.runs], [run.run_id for run in runs])
+        self.assertEqual(len(result.successful_runs), 4)
+        self.assertEqual(mock_execute.call_count, 4)
+
+    @patch.object(CodexRun, 'execute', autospec=True)
+    def test_execute_all_checkpoint_skips_completed_runs(self, mock_execute):
+        """Test a checkpointed session skips runs completed by an earlier invocation."""
+        checkpoint_path = os.path.join(self.temp_dir, "session.json")
+        
+        def execute(run, log_dir):
+            run.log_file = os.path.join(log_dir, f"codex_run_{run.run_id}.log")
+            with open(run.log_file, 'w') as f:
+                f.write("")
+            run.success = run.run_id != "task-2"
+            run.result = CodexRunResult(run_id=run.run_id, start_time=datetime.now(), success=run.success)
+            return run.result
+        
+        mock_execute.side_effect = execute
+        
+        def make_session():
+            session = CodexSession(session_id=self.session_id, log_dir=self.temp_dir,
+                                   validate_env=False, checkpoint_path=checkpoint_path)
+            for i in range(3):
+                session.add_run(f"Prompt {i}", run_id=f"task-{i}")
+            return session
+        
+        make_session().execute_all()
+        self.assertEqual(mock_execute.call_count, 3)
+        
+        # Only the failed run executes again; the others are re-parsed from their logs
+        result = make_session().execute_all()
+        self.assertEqual(mock_execute.call_count, 4)
+        self.assertEqual(mock_execute.call_args[0][0].run_id, "task-2")
+        self.assertEqual([r.run_id for r in result.runs], ["task-0", "task-1", "task-2"])
+
+    @patch.object(CodexRun, '_parse_results', autospec=True)
+    @patch.object(CodexRun, '_execute_codex', autospec=True)
+    def test_execute_all_checkpoint_shared_prefix_run_ids(self, mock_execute_codex, mock_parse_results):
+        """Test concurrent runs whose IDs share a long prefix get their own log files."""
+        checkpoint_path = os.path.join(self.temp_dir, "session.json")
+        run_ids = ["leetcode/problem-01", "leetcode/problem-02"]
+        
+        def execute_codex(run):
+            with open(run.log_file, 'w') as f:
+                f.write(run.run_id)
+        
+        mock_execute_codex.side_effect = execute_codex
+        mock_parse_results.side_effect = lambda run: CodexRunResult(
+            run_id=run.run_id, start_time=datetime.now(), success=True)
+        
+        session = CodexSession(session_id=self.session_id, log_dir=self.temp_dir, validate_env=False,
+                               enable_health_monitoring=False, checkpoint_path=checkpoint_path)
+        for run_id in run_ids:
+            session.add_run(f"Prompt {run_id}", run_id=run_id)
+        session.execute_all(max_workers=2)
+        
+        log_files = [run.log_file for run in session.runs]
+        self.assertEqual(len(set(log_files)), 2)
+        for run_id, log_file in zip(run_ids, log_files):
+            self.assertEqual(os.path.dirname(log_file), self.temp_dir)
+            with open(log_file) as f:
+                self.assertEqual(f.read(), run_id)
+        self.assertEqual(session._load_checkpoint(), dict(zip(run_ids, log_files)))
+    
+    @patch.object(CodexRun, 'execute', autospec=True)
+    @patch.object(CodexRun, '_parse_results', autospec=True)
+    def test_execute_all_checkpoint_unreadable_log(self, mock_parse_results, mock_execute):
+        """Test a checkpointed log that cannot be parsed fails its run, not the session."""
+        log_file = os.path.join(self.temp_dir, "codex_run_task-0.log")
+        with open(log_file, 'w') as f:
+            f.write("")
+        checkpoint_path = os.path.join(self.temp_dir, "session.json")
+        with open(checkpoint_path, 'w') as f:
+            json.dump({'completed': {'task-0': log_file}}, f)
+        
+        mock_parse_results.side_effect = RuntimeError("unreadable log")
+        mock_execute.side_effect = lambda run, log_dir: CodexRunResult(
+            run_id=run.run_id, start_time=datetime.now(), success=True)
+        
+        session = CodexSession(session_id=self.session_id, log_dir=self.temp_dir,
+                               validate_env=False, checkpoint_path=checkpoint_path)
+        session.add_run("Prompt 0", run_id="task-0")
+        session.add_run("Prompt 1", run_id="task-1")
+        result = session.execute_all(max_workers=2)
+        
+        self.assertIsNone(result.runs[0])
+        self.assertEqual(result.runs[1].run_id, "task-1")
+        self.assertFalse(session.runs[0].success)
+
     @patch('auto_codex.core.TemplateProcessor')
     def test_process_csv_data(self, mock_template_processor_class):
         """Test processing CSV data with template."""
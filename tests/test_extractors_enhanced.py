@@ -6,7 +6,7 @@ import json
 import re
 from auto_codex.extractors import (
     BaseExtractor, PatchExtractor, CommandExtractor, ToolUsageExtractor, 
-    ChangeDetector, CustomExtractor, GenericToolExtractor
+    ChangeDetector, CustomExtractor, GenericToolExtractor, parse_json_lines
 )
 from auto_codex.models import (
     PatchData, CodexCommand, ToolUsage, CodexChange, DiscoveredTool,
@@ -496,5 +496,31 @@ class TestGenericToolExtractor(unittest.TestCase):
         self.assertEqual(len(results), 2)
 
 
+class TestSharedJsonLines(unittest.TestCase):
+    """Test extractors reading from one shared decoding pass."""
+
+    def test_extract_entries_matches_extract(self):
+        """Test extract_entries on parse_json_lines output matches extract."""
+        log_file = "test.log"
+        log_content = "\r\n".join([
+            json.dumps({
+                "type": "function_call",
+                "name": "shell",
+                "arguments": json.dumps({"command": ["apply_patch", "*** Begin Patch\n*** Add File: a.py\n+x = 1\n*** End Patch"]})
+            }),
+            "not json",
+            json.dumps({"type": "codex_change", "change_type": "patch", "file_path": "a.py"}),
+            json.dumps({"type": "tool_use", "name": "read_file", "arguments": {"path": "a.py"}})
+        ])
+
+        entries = parse_json_lines(log_content)
+        self.assertEqual(len(entries), 3)
+
+        for extractor in (PatchExtractor(), CommandExtractor(), ToolUsageExtractor(), ChangeDetector()):
+            shared = extractor.extract_entries(log_file, entries)
+            self.assertTrue(shared)
+            self.assertEqual(shared, extractor.extract(log_file, log_content))
+
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
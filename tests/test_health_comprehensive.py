@@ -123,6 +123,20 @@ class TestAgentHealthInfo(unittest.TestCase):
             )
             self.assertFalse(info.is_running, f"Status {status} should not be running")
 
+    def test_is_finished_property(self):
+        """Test is_finished property for different statuses."""
+        start_time = datetime.now()
+        finished = {AgentStatus.COMPLETED, AgentStatus.FAILED, AgentStatus.CANCELLED, AgentStatus.TIMEOUT}
+        
+        for status in AgentStatus:
+            info = AgentHealthInfo(
+                agent_id="test-agent",
+                status=status,
+                health=HealthStatus.HEALTHY,
+                start_time=start_time
+            )
+            self.assertEqual(info.is_finished, status in finished, f"Status {status}")
+
     def test_is_responsive_property(self):
         """Test is_responsive property."""
         start_time = datetime.now()
@@ -239,6 +253,17 @@ class TestAgentHealthMonitor(unittest.TestCase):
         info = self.monitor.get_agent_health("unknown-agent")
         self.assertIsNone(info)
 
+    def test_get_agents_health(self):
+        """Test bulk lookup of agent health info."""
+        self.monitor.register_agent("agent-1")
+        self.monitor.register_agent("agent-2")
+        self.monitor.register_agent("agent-3")
+        
+        agents = self.monitor.get_agents_health(["agent-1", "agent-3", "unknown-agent"])
+        
+        self.assertEqual(set(agents), {"agent-1", "agent-3"})
+        self.assertEqual(agents["agent-3"].agent_id, "agent-3")
+
     def test_get_all_agents(self):
         """Test getting all agents."""
         # Register some agents
@@ -353,6 +378,32 @@ class TestAgentHealthMonitor(unittest.TestCase):
         # Just test that the method exists and doesn't raise
         self.assertEqual(len(self.monitor._error_callbacks), 1)
 
+    def test_remove_callbacks(self):
+        """Test removed callbacks are no longer called."""
+        callback_called = []
+        
+        def test_callback(agent_id, status):
+            callback_called.append((agent_id, status))
+        
+        health_callback = lambda agent_id, health: None
+        error_callback = lambda agent_id, error: None
+        self.monitor.add_status_callback(test_callback)
+        self.monitor.add_health_callback(health_callback)
+        self.monitor.add_error_callback(error_callback)
+        
+        self.monitor.remove_status_callback(test_callback)
+        self.monitor.remove_health_callback(health_callback)
+        self.monitor.remove_error_callback(error_callback)
+        # Removing a callback twice is harmless
+        self.monitor.remove_status_callback(test_callback)
+        
+        self.monitor.register_agent("test-agent")
+        self.monitor.update_agent_status("test-agent", AgentStatus.RUNNING)
+        
+        self.assertEqual(callback_called, [])
+        self.assertEqual(self.monitor._health_callbacks, [])
+        self.assertEqual(self.monitor._error_callbacks, [])
+
     def test_get_summary_stats(self):
         """Test getting summary statistics."""
         # Register some agents with different states
@@ -72,6 +72,24 @@ class TestCodexLogParserErrorHandling(unittest.TestCase):
         results = self.parser.parse_logs(content_filter=reject_all_content)
         self.assertEqual(results, [])
     
+    def test_parse_logs_with_process_pool(self):
+        """Test parse_logs with several workers matches the sequential result."""
+        line = json.dumps({
+            "type": "function_call",
+            "name": "shell",
+            "arguments": json.dumps({"command": ["ls", "-la"]})
+        })
+        for i in range(3):
+            with open(os.path.join(self.temp_dir, f"codex_run_{i}.log"), 'w') as f:
+                f.write("\n".join([line] * (i + 1)))
+        
+        parser = CodexLogParser(self.temp_dir)
+        sequential = parser.parse_logs()
+        parallel = parser.parse_logs(max_workers=2)
+        
+        self.assertTrue(sequential)
+        self.assertEqual(parallel, sequential)
+    
     def test_get_patches_error_handling(self):
         """Test get_patches handles errors gracefully."""
         # Mock parse_logs to raise exception
@@ -357,6 +375,15 @@ class TestCodexOutputParserErrorHandling(unittest.TestCase):
             self.assertIn('file_path', edit)
             self.assertIn('context', edit)
             self.assertIn('line_number', edit)
+    
+    def test_extract_suggested_edits_line_numbers(self):
+        """Test extract_suggested_edits reports the line each match starts on."""
+        content = "intro\nmodify file: a.py\n\nmodify file: b.py\nsuggested edit file: c.py\n"
+        
+        result = self.parser.extract_suggested_edits(content)
+        
+        lines = {edit['file_path']: edit['line_number'] for edit in result}
+        self.assertEqual(lines, {'a.py': 2, 'b.py': 4, 'c.py': 5})
 
 
 if __name__ == '__main__':